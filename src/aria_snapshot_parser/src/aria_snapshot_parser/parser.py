@@ -2,6 +2,8 @@
 
 # ruff: noqa: N802, N803
 
+import re
+import sys
 from typing import Any
 
 from antlr4 import CommonTokenStream, InputStream
@@ -20,6 +22,24 @@ from .utils import (
     validate_level,
 )
 
+# Regex mirror of the AriaKey grammar for well-formed keys. Keys it does not match
+# (and keys whose attributes fail validation) go through the ANTLR parser, which
+# reports the errors; WS may separate any two tokens, as in the grammar
+_WS = r"[ \t\r\n]*"
+_IDENTIFIER = r"[a-zA-Z_][a-zA-Z0-9_-]*"
+_STRING = r'"(?:\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4})|[^"\\\x00-\x1f])*"'
+_REGEX = r"/(?:\\[\s\S]|[^/\\\r\n])+/"
+_ATTR_VALUE = rf"{_IDENTIFIER}|{_STRING}|[0-9]+"
+_KEY_FAST = re.compile(
+    rf"{_WS}(?P<role>{_IDENTIFIER})"
+    rf"(?:{_WS}(?:(?P<string>{_STRING})|(?P<regex>{_REGEX})))?"
+    rf"(?P<attributes>(?:{_WS}\[{_WS}{_IDENTIFIER}{_WS}(?:={_WS}(?:{_ATTR_VALUE}){_WS})?\])*)"
+    rf"{_WS}"
+)
+_ATTRIBUTE_FAST = re.compile(
+    rf"\[{_WS}(?P<name>{_IDENTIFIER}){_WS}(?:={_WS}(?P<value>{_ATTR_VALUE}){_WS})?\]"
+)
+
 
 class AriaSnapshotErrorListener(ErrorListener):
     """Custom error listener for ANTLR parser."""
@@ -72,7 +92,8 @@ class AriaKeyNodeBuilder(AriaKeyVisitor):
 
     def visitRole(self, ctx: Any) -> str:
         """Visit role rule: IDENTIFIER"""
-        return ctx.IDENTIFIER().getText()
+        # Interned: a snapshot repeats a handful of roles across thousands of nodes
+        return sys.intern(ctx.IDENTIFIER().getText())
 
     def visitName(self, ctx: Any) -> AriaTextValue:
         """Visit name rule: STRING | REGEX"""
@@ -164,9 +185,12 @@ class AriaSnapshotParser:
     """Parser for ARIA snapshot YAML format."""
 
     def __init__(self) -> None:
-        self.yaml = YAML()
-        self.yaml.preserve_quotes = True
+        # Only plain dicts, lists and scalars are consumed, so the safe loader is
+        # enough; it uses the libyaml-based C parser when ruamel.yaml.clib is present
+        self.yaml = YAML(typ="safe")
         self.errors: list[ParseError] = []
+        # Attribute validation for the regex fast path (stateless)
+        self._attribute_builder = AriaKeyNodeBuilder()
 
     def parse(self, text: str) -> tuple[list[AriaTemplateNode] | None, list[ParseError]]:
         """
@@ -244,7 +268,7 @@ class AriaSnapshotParser:
 
             # Otherwise, might be an ARIA key like: button "Submit" [ref=e1]
             # Try to parse it as a key first
-            aria_node = self._parse_key_with_antlr(node, yaml_path)
+            aria_node = self._parse_key(node, yaml_path)
             if aria_node:
                 return aria_node
             # Otherwise, return as plain text
@@ -277,7 +301,7 @@ class AriaSnapshotParser:
 
             else:
                 # Parse key with ANTLR
-                aria_node = self._parse_key_with_antlr(key, yaml_path)
+                aria_node = self._parse_key(key, yaml_path)
 
                 if aria_node and value is not None:
                     # Process value - mark as dict value so strings aren't parsed as ARIA keys
@@ -328,6 +352,57 @@ class AriaSnapshotParser:
 
         return None
 
+    def _parse_key(self, key_text: str, yaml_path: str) -> AriaTemplateNode | None:
+        """Parse key, using the regex fast path when the key is well-formed."""
+        node = self._parse_key_fast(key_text)
+        if node is not None:
+            return node
+        return self._parse_key_with_antlr(key_text, yaml_path)
+
+    def _parse_key_fast(self, key_text: str) -> AriaTemplateNode | None:
+        """Parse a well-formed key without ANTLR; None means fall back to the grammar."""
+        match = _KEY_FAST.fullmatch(key_text)
+        if match is None:
+            return None
+
+        # 'mixed' is its own token in the grammar, so it is not a valid identifier there
+        role = match.group("role")
+        if role == "mixed":
+            return None
+        role = sys.intern(role)
+
+        name: AriaTextValue | None = None
+        if match.group("string") is not None:
+            name = AriaTextValue(value=unescape_string(match.group("string")), is_regex=False)
+        elif match.group("regex") is not None:
+            name = AriaTextValue(value=match.group("regex")[1:-1], is_regex=True)
+
+        attrs: dict[str, Any] = {}
+        for attr in _ATTRIBUTE_FAST.finditer(match.group("attributes")):
+            attr_name, attr_value = attr.group("name", "value")
+            if attr_name == "mixed":
+                return None
+            if attr_value is not None and attr_value.startswith('"'):
+                attr_value = unescape_string(attr_value)
+            try:
+                attrs.update(self._attribute_builder._process_attribute(attr_name, attr_value))
+            except (ValueError, ValidationError):
+                return None
+
+        return AriaTemplateNode(
+            role=role,
+            name=name,
+            checked=attrs.get("checked"),
+            disabled=attrs.get("disabled"),
+            expanded=attrs.get("expanded"),
+            active=attrs.get("active"),
+            level=attrs.get("level"),
+            pressed=attrs.get("pressed"),
+            selected=attrs.get("selected"),
+            ref=attrs.get("ref"),
+            cursor=attrs.get("cursor"),
+        )
+
     def _parse_key_with_antlr(self, key_text: str, yaml_path: str) -> AriaTemplateNode | None:
         """Parse key using ANTLR grammar."""
         try:
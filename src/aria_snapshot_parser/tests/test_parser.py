@@ -1,7 +1,7 @@
 """Tests for ARIA snapshot parser."""
 
 
-from aria_snapshot_parser import parse
+from aria_snapshot_parser import AriaSnapshotParser, parse
 from aria_snapshot_parser.types import AriaTemplateNode
 
 
@@ -180,3 +180,37 @@ class TestAriaSnapshotParser:
         assert paragraph.role == "paragraph"
         assert paragraph.ref == "e4"
         assert paragraph.name.value == "This domain is for use in documentation examples without needing permission. Avoid use in operations."
+
+    def test_fast_key_path_matches_antlr(self):
+        """Test that the regex key fast path builds the same nodes as the grammar."""
+        parser = AriaSnapshotParser()
+        keys = [
+            "navigation",
+            'button "Submit" [ref=e1] [cursor=pointer]',
+            'heading "Say \\"hi\\"" [level=2] [ref=e2]',
+            "checkbox /Accept.*/ [checked=mixed] [disabled]",
+            'link"Home"[ ref = e3 ][cursor="pointer"]',
+        ]
+
+        for key in keys:
+            fast = parser._parse_key_fast(key)
+            assert fast is not None
+            assert fast == parser._parse_key_with_antlr(key, "root")
+        assert parser.errors == []
+
+    def test_fast_key_path_defers_invalid_keys(self):
+        """Test that keys needing error reporting fall back to the grammar."""
+        parser = AriaSnapshotParser()
+
+        for key in ['button "Submit" [bogus=1]', "heading [level=9]", "mixed", "button extra"]:
+            assert parser._parse_key_fast(key) is None
+
+        _, errors = parse('- button "Submit" [bogus=1]')
+        assert [e.message for e in errors] == ["Unknown attribute: bogus"]
+
+    def test_roles_are_interned(self):
+        """Test that repeated roles share one string object."""
+        tree, errors = parse('- button "A" [ref=e1]\n- button "B" [ref=e2]')
+
+        assert errors == []
+        assert tree[0].role is tree[1].role
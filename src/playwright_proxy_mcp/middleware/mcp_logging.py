@@ -5,11 +5,11 @@ Logs all incoming MCP requests and outgoing responses to track client interactio
 Uses clear prefixes to distinguish from upstream playwright-mcp proxy calls.
 """
 
-import json
 import logging
 import time
 from typing import Any
 
+import orjson
 from fastmcp.server.middleware import Middleware, MiddlewareContext
 
 logger = logging.getLogger(__name__)
@@ -264,7 +264,7 @@ class MCPLoggingMiddleware(Middleware):
             Truncated string representation
         """
         try:
-            json_str = json.dumps(data, default=str)
+            json_str = orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
             if len(json_str) > max_length:
                 return json_str[:max_length] + f"... ({len(json_str)} chars total)"
             return json_str
@@ -8,7 +8,6 @@ of large binary data like screenshots, PDFs, and videos.
 import asyncio
 import base64
 import logging
-import re
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -19,6 +18,52 @@ from .config import BlobConfig
 
 logger = logging.getLogger(__name__)
 
+_DATA_URI_PREFIX = "data:"
+_BASE64_MARKER = ";base64,"
+
+
+def parse_data_uri_header(value: str) -> tuple[str | None, int]:
+    """
+    Parse the header of a base64 data URI without touching the payload.
+
+    Args:
+        value: Data URI (data:mime/type;base64,<data>) or bare base64 string
+
+    Returns:
+        Tuple of (MIME type, payload offset); (None, 0) if value is not a data URI
+    """
+    if not value.startswith(_DATA_URI_PREFIX):
+        return None, 0
+
+    marker = value.find(";", len(_DATA_URI_PREFIX))
+    if marker <= len(_DATA_URI_PREFIX) or not value.startswith(_BASE64_MARKER, marker):
+        return None, 0
+
+    payload_start = marker + len(_BASE64_MARKER)
+    if payload_start == len(value):
+        return None, 0
+
+    return value[len(_DATA_URI_PREFIX) : marker], payload_start
+
+
+def split_data_uri(value: str) -> tuple[str | None, str]:
+    """
+    Split a base64 data URI into its MIME type and payload.
+
+    Only the short header is inspected, so multi-MB payloads are never
+    scanned by a regex before being decoded.
+
+    Args:
+        value: Data URI (data:mime/type;base64,<data>) or bare base64 string
+
+    Returns:
+        Tuple of (MIME type, base64 payload); MIME type is None if value is not a data URI
+    """
+    mime_type, payload_start = parse_data_uri_header(value)
+    if mime_type is None:
+        return None, value
+    return mime_type, value[payload_start:]
+
 
 class PlaywrightBlobManager:
     """Manages blob storage for playwright binary data"""
@@ -33,9 +78,12 @@ class PlaywrightBlobManager:
         self.config = config
         self._cleanup_task: asyncio.Task | None = None
 
+        # Resolve config-derived values once instead of on every blob operation
+        self._storage_path = Path(config["storage_root"])
+        self._ttl = timedelta(hours=config["ttl_hours"])
+
         # Ensure storage directory exists
-        storage_path = Path(config["storage_root"])
-        storage_path.mkdir(parents=True, exist_ok=True)
+        self._storage_path.mkdir(parents=True, exist_ok=True)
 
         # Initialize blob storage
         self.storage = BlobStorage(
@@ -70,14 +118,9 @@ class PlaywrightBlobManager:
         """
         try:
             # Extract MIME type and data from data URI if present
-            mime_type = "application/octet-stream"
-            data_part = base64_data
-
-            # Check for data URI format: data:mime/type;base64,<data>
-            data_uri_match = re.match(r"data:([^;]+);base64,(.+)", base64_data)
-            if data_uri_match:
-                mime_type = data_uri_match.group(1)
-                data_part = data_uri_match.group(2)
+            mime_type, data_part = split_data_uri(base64_data)
+            if mime_type is None:
+                mime_type = "application/octet-stream"
 
             # Decode base64 to binary
             binary_data = base64.b64decode(data_part)
@@ -87,7 +130,7 @@ class PlaywrightBlobManager:
 
             # Calculate metadata
             size_bytes = len(binary_data)
-            expires_at = datetime.now() + timedelta(hours=self.config["ttl_hours"])
+            expires_at = datetime.now() + self._ttl
 
             logger.info(f"Stored blob {result['blob_id']} ({size_bytes} bytes, type: {mime_type})")
 
@@ -171,8 +214,7 @@ class PlaywrightBlobManager:
         """
         try:
             # Get all blobs (mcp-mapped-resource-lib doesn't have built-in filtering)
-            storage_path = Path(self.config["storage_root"])
-            blob_files = list(storage_path.glob("blob_*"))
+            blob_files = list(self._storage_path.glob("blob_*"))
 
             results = []
             for blob_file in blob_files[:limit]:
@@ -243,7 +285,11 @@ class PlaywrightBlobManager:
         try:
             from mcp_mapped_resource_lib import maybe_cleanup_expired_blobs
 
-            deleted_count = maybe_cleanup_expired_blobs(self.config["storage_root"])
+            # The sweep stats and unlinks files synchronously; run it in a worker
+            # thread so a large blob directory never stalls in-flight tool calls
+            deleted_count = await asyncio.to_thread(
+                maybe_cleanup_expired_blobs, self.config["storage_root"]
+            )
             if deleted_count > 0:
                 logger.info(f"Cleaned up {deleted_count} expired blobs")
             return deleted_count
@@ -253,12 +299,15 @@ class PlaywrightBlobManager:
             return 0
 
     async def start_cleanup_task(self) -> None:
-        """Start periodic cleanup task for expired blobs"""
+        """Start periodic cleanup task for expired blobs (disabled if the interval is <= 0)"""
         if self._cleanup_task is not None:
             logger.warning("Cleanup task already running")
             return
 
         interval_seconds = self.config["cleanup_interval_minutes"] * 60
+        if interval_seconds <= 0:
+            logger.info("Blob cleanup task disabled (cleanup_interval_minutes <= 0)")
+            return
 
         async def cleanup_loop() -> None:
             while True:
@@ -7,12 +7,30 @@ blob storage references to reduce token usage.
 
 import logging
 import re
+from types import MappingProxyType
 from typing import Any
 
-from .blob_manager import PlaywrightBlobManager
+from .blob_manager import PlaywrightBlobManager, parse_data_uri_header
 
 logger = logging.getLogger(__name__)
 
+_BASE64_PATTERN = re.compile(r"[A-Za-z0-9+/]+=*")
+
+# Map common MIME types to extensions
+_MIME_TO_EXTENSION = MappingProxyType({
+    "image/png": ".png",
+    "image/jpeg": ".jpg",
+    "image/jpg": ".jpg",
+    "image/gif": ".gif",
+    "image/webp": ".webp",
+    "image/svg+xml": ".svg",
+    "application/pdf": ".pdf",
+    "video/webm": ".webm",
+    "video/mp4": ".mp4",
+    "application/x-tar": ".tar",
+    "application/zip": ".zip",
+})
+
 
 class BinaryInterceptionMiddleware:
     """
@@ -22,21 +40,25 @@ class BinaryInterceptionMiddleware:
 
     # Tools that always produce binary data
     # Note: includes both playwright_ prefixed names (from server.py) and browser_ prefixed names (from @playwright/mcp)
-    BINARY_TOOLS = {
+    BINARY_TOOLS = frozenset({
         "playwright_screenshot",
         "browser_take_screenshot",
         "playwright_pdf",
         "playwright_save_as_pdf",
         "browser_pdf",
-    }
+        "browser_pdf_save",
+    })
 
     # Tools that may produce binary data
-    CONDITIONAL_BINARY_TOOLS = {
+    CONDITIONAL_BINARY_TOOLS = frozenset({
         "playwright_get_console",
         "playwright_download",
         "browser_console",
         "browser_download",
-    }
+    })
+
+    # Every tool whose response is worth inspecting; all other responses skip the blob scan
+    BLOB_CANDIDATE_TOOLS = BINARY_TOOLS | CONDITIONAL_BINARY_TOOLS
 
     def __init__(self, blob_manager: PlaywrightBlobManager, size_threshold_kb: int = 50) -> None:
         """
@@ -97,9 +119,7 @@ class BinaryInterceptionMiddleware:
             response_dict['content'] = converted_content
 
         # Check if this tool produces binary data
-        should_check = tool_name in self.BINARY_TOOLS or tool_name in self.CONDITIONAL_BINARY_TOOLS
-
-        if not should_check:
+        if tool_name not in self.BLOB_CANDIDATE_TOOLS:
             return response_dict
 
         # Look for base64 data in the response
@@ -237,29 +257,22 @@ class BinaryInterceptionMiddleware:
         Returns:
             True if should be stored as blob
         """
-        # Check for data URI pattern
-        data_uri_match = re.match(r"data:([^;]+);base64,(.+)", value)
-        if not data_uri_match:
-            # Not a data URI, check if it's a large base64 string
-            # (heuristic: long string with base64 characters)
-            if len(value) < 100:
-                return False
-
-            # Check if it looks like base64
-            if not re.match(r"^[A-Za-z0-9+/]+=*$", value):
-                return False
-
-        # Estimate size
+        # Size the payload from its length alone; slicing out the base64 part of a
+        # multi-MB data URI just to measure it would copy the whole payload
+        mime_type, payload_start = parse_data_uri_header(value)
+        if mime_type is None and len(value) < 100:
+            return False
+
         # Base64 encoding increases size by ~33%, so we reverse that
-        if data_uri_match:
-            base64_data = data_uri_match.group(2)
-        else:
-            base64_data = value
+        estimated_binary_size = (len(value) - payload_start) * 3 // 4
+        if estimated_binary_size < self.size_threshold_bytes:
+            return False
 
-        estimated_binary_size = len(base64_data) * 3 // 4
+        # Not a data URI: only large strings that look like base64 qualify
+        if mime_type is None:
+            return _BASE64_PATTERN.fullmatch(value) is not None
 
-        # Check against threshold
-        return estimated_binary_size >= self.size_threshold_bytes
+        return True
 
     async def _store_as_blob(
         self, base64_data: str, field_name: str, tool_name: str
@@ -296,12 +309,10 @@ class BinaryInterceptionMiddleware:
         Returns:
             File extension (e.g., ".png")
         """
-        # Check for data URI pattern
-        match = re.match(r"data:([^;]+);base64,", data)
-        if not match:
+        mime_type, _ = parse_data_uri_header(data)
+        if mime_type is None:
             return ".bin"
 
-        mime_type = match.group(1)
         return self._get_extension_from_mime_type(mime_type)
 
     def _get_extension_from_mime_type(self, mime_type: str) -> str:
@@ -314,22 +325,7 @@ class BinaryInterceptionMiddleware:
         Returns:
             File extension (e.g., ".png")
         """
-        # Map common MIME types to extensions
-        mime_to_ext = {
-            "image/png": ".png",
-            "image/jpeg": ".jpg",
-            "image/jpg": ".jpg",
-            "image/gif": ".gif",
-            "image/webp": ".webp",
-            "image/svg+xml": ".svg",
-            "application/pdf": ".pdf",
-            "video/webm": ".webm",
-            "video/mp4": ".mp4",
-            "application/x-tar": ".tar",
-            "application/zip": ".zip",
-        }
-
-        return mime_to_ext.get(mime_type, ".bin")
+        return _MIME_TO_EXTENSION.get(mime_type, ".bin")
 
     def _object_to_dict(self, obj: Any) -> dict[str, Any]:
         """
@@ -105,6 +105,8 @@ class BrowserPool:
         self.description = config["description"]
         self.instances: dict[str, BrowserInstance] = {}
         self.lease_queue: LeasedKeyQueue[str, BrowserInstance] | None = None
+        # Maintained by the health check loop so leasing never has to rescan instances
+        self.healthy_instance_count = 0
         self._config = config
 
     async def initialize(
@@ -119,9 +121,30 @@ class BrowserPool:
         """
         logger.info(f"Initializing pool '{self.name}' with {len(self._config['instance_configs'])} instances")
 
-        # Create all instances
-        for instance_cfg in self._config["instance_configs"]:
-            await self._create_instance(instance_cfg, blob_manager, middleware)
+        # Create all instances concurrently so pool startup waits for the slowest
+        # npx/browser launch rather than the sum of all of them
+        instance_configs = self._config["instance_configs"]
+        results = await asyncio.gather(
+            *(
+                self._create_instance(instance_cfg, blob_manager, middleware)
+                for instance_cfg in instance_configs
+            ),
+            return_exceptions=True,
+        )
+        failures = [result for result in results if isinstance(result, BaseException)]
+        if failures:
+            # Stop the instances that did start so their subprocesses are not orphaned
+            await self.stop()
+            raise failures[0]
+
+        # Restore configuration order (instances register in completion order)
+        config_order = {cfg["instance_id"]: index for index, cfg in enumerate(instance_configs)}
+        self.instances = dict(
+            sorted(self.instances.items(), key=lambda item: config_order.get(item[0], 0))
+        )
+
+        # Freshly started instances are considered healthy until the first health check
+        self.healthy_instance_count = len(self.instances)
 
         # Create lease queue
         self.lease_queue = LeasedKeyQueue[str, BrowserInstance]()
@@ -159,31 +182,39 @@ class BrowserPool:
             f"Creating instance {instance_id} in pool '{self.name}'"
             + (f" (alias: {alias})" if alias else "")
         )
-        logger.debug(f"Instance config: browser={config.get('browser', 'N/A')}, "
-                    f"headless={config.get('headless', 'N/A')}, "
-                    f"wsl_windows={config.get('wsl_windows', False)}")
+        logger.debug(
+            "Instance config: browser=%s, headless=%s, wsl_windows=%s",
+            config.get("browser", "N/A"),
+            config.get("headless", "N/A"),
+            config.get("wsl_windows", False),
+        )
 
         try:
             # Create process manager
-            logger.debug(f"  [1/4] Creating PlaywrightProcessManager for instance {instance_id}")
+            logger.debug("  [1/4] Creating PlaywrightProcessManager for instance %s", instance_id)
             process_manager = PlaywrightProcessManager()
 
             # Create proxy client
-            logger.debug(f"  [2/4] Creating PlaywrightProxyClient for instance {instance_id}")
+            logger.debug("  [2/4] Creating PlaywrightProxyClient for instance %s", instance_id)
             proxy_client = PlaywrightProxyClient(process_manager, middleware)
 
             # Start proxy client (spawns subprocess)
             logger.info(f"  [3/4] Starting proxy client (spawning subprocess) for instance {instance_id}")
             await proxy_client.start(config)
-            logger.debug(f"  Proxy client started for instance {instance_id}")
+            logger.debug("  Proxy client started for instance %s", instance_id)
 
             # Register process with process manager for monitoring
-            logger.debug(f"  [4/4] Registering process with process manager for instance {instance_id}")
+            logger.debug(
+                "  [4/4] Registering process with process manager for instance %s", instance_id
+            )
             if proxy_client._client and hasattr(proxy_client._client, "_transport"):
                 transport = proxy_client._client._transport
                 if hasattr(transport, "_process"):
                     await process_manager.set_process(transport._process)
-                    logger.debug(f"  Process registered (PID: {transport._process.pid if hasattr(transport._process, 'pid') else 'unknown'})")
+                    logger.debug(
+                        "  Process registered (PID: %s)",
+                        getattr(transport._process, "pid", "unknown"),
+                    )
                 else:
                     logger.warning(f"  Transport has no _process attribute for instance {instance_id}")
             else:
@@ -366,6 +397,7 @@ class BrowserPool:
         # Check all instances concurrently
         tasks = [instance.check_health() for instance in self.instances.values()]
         results = await asyncio.gather(*tasks, return_exceptions=True)
+        self.healthy_instance_count = sum(1 for result in results if result is True)
 
         # Log results
         for instance, result in zip(self.instances.values(), results):
@@ -412,10 +444,27 @@ class PoolManager:
             f"Initializing pool manager with {len(self.config['pools'])} pools"
         )
 
-        # Create and initialize all pools
-        for pool_config in self.config["pools"]:
-            pool = BrowserPool(pool_config)
-            await pool.initialize(self.blob_manager, self.middleware)
+        # Create and initialize all pools concurrently
+        pools = [BrowserPool(pool_config) for pool_config in self.config["pools"]]
+        results = await asyncio.gather(
+            *(pool.initialize(self.blob_manager, self.middleware) for pool in pools),
+            return_exceptions=True,
+        )
+        failures = [result for result in results if isinstance(result, BaseException)]
+        if failures:
+            # A failed pool has already stopped its own instances; stop the pools that
+            # did start, since they are never registered for shutdown to find
+            await asyncio.gather(
+                *(
+                    pool.stop()
+                    for pool, result in zip(pools, results)
+                    if not isinstance(result, BaseException)
+                ),
+                return_exceptions=True,
+            )
+            raise failures[0]
+
+        for pool_config, pool in zip(self.config["pools"], pools):
             self.pools[pool_config["name"]] = pool
 
         logger.info(
@@ -464,30 +513,22 @@ class PoolManager:
         if not pool_name:
             pool_name = self.default_pool_name
 
-        # Check pool exists
-        if pool_name not in self.pools:
+        # Check pool exists (single lookup on the per-call hot path)
+        pool = self.pools.get(pool_name)
+        if pool is None:
             available = ", ".join(self.pools.keys())
             raise ValueError(
                 f"Pool '{pool_name}' not found. Available pools: {available}"
             )
 
-        pool = self.pools[pool_name]
-
-        # If this is the default pool and it was requested implicitly,
-        # check that it has healthy instances
-        if not pool_name or pool_name == self.default_pool_name:
-            healthy_count = sum(
-                1
-                for instance in pool.instances.values()
-                if not instance.health_check_error
+        # The default pool must have healthy instances; the count is kept current
+        # by the health check loop, so this is a plain attribute read per call
+        if pool_name == self.default_pool_name and pool.healthy_instance_count == 0:
+            raise ValueError(
+                f"Default pool '{pool.name}' has no healthy instances. "
+                f"Specify explicit pool or restart failed instances."
             )
 
-            if healthy_count == 0:
-                raise ValueError(
-                    f"Default pool '{pool.name}' has no healthy instances. "
-                    f"Specify explicit pool or restart failed instances."
-                )
-
         return pool
 
     @asynccontextmanager
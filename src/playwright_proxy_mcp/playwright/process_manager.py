@@ -9,9 +9,13 @@ by StdioTransport, but this class provides logging and monitoring.
 import asyncio
 import logging
 from asyncio.subprocess import Process
+from collections.abc import AsyncIterator
 
 logger = logging.getLogger(__name__)
 
+# Bytes requested per read from the subprocess output pipes
+_READ_CHUNK_SIZE = 64 * 1024
+
 
 class PlaywrightProcessManager:
     """Manages playwright-mcp subprocess logging and monitoring"""
@@ -72,6 +76,39 @@ class PlaywrightProcessManager:
         self.process = None
         logger.info("Process monitoring stopped")
 
+    @staticmethod
+    async def _iter_lines(stream: asyncio.StreamReader) -> AsyncIterator[bytes]:
+        """
+        Yield lines from a subprocess stream, reading it in large chunks.
+
+        A burst of output is picked up with one read per chunk rather than one
+        readline() per line. Partial lines longer than a chunk (e.g. a base64
+        payload echoed to stderr) are flushed as-is instead of buffering them.
+
+        Args:
+            stream: Subprocess stdout or stderr reader
+
+        Yields:
+            Lines without their trailing newline
+        """
+        pending = b""
+        while True:
+            chunk = await stream.read(_READ_CHUNK_SIZE)
+            if not chunk:
+                break
+
+            lines = (pending + chunk).split(b"\n")
+            pending = lines.pop()
+            if len(pending) > _READ_CHUNK_SIZE:
+                lines.append(pending)
+                pending = b""
+
+            for line in lines:
+                yield line
+
+        if pending:
+            yield pending
+
     async def _log_stdout(self) -> None:
         """
         Background task to read and log stdout from subprocess.
@@ -84,17 +121,14 @@ class PlaywrightProcessManager:
         logger.debug("Logging stdout from subprocess")
 
         try:
-            while True:
-                line = await self.process.stdout.readline()
-                if not line:
-                    logger.debug("No more stdout output from subprocess")
-                    break
-
+            async for line in self._iter_lines(self.process.stdout):
                 # Decode and log stdout output
                 stdout_line = line.decode("utf-8", errors="replace").rstrip()
                 if stdout_line:
                     logger.info(f"UPSTREAM_MCP [stdout] {stdout_line}")
 
+            logger.debug("No more stdout output from subprocess")
+
         except asyncio.CancelledError:
             logger.debug("Stdout logger task cancelled")
             raise
@@ -113,17 +147,14 @@ class PlaywrightProcessManager:
         logger.debug("Logging stderr from subprocess")
 
         try:
-            while True:
-                line = await self.process.stderr.readline()
-                if not line:
-                    logger.debug("No more stderr output from subprocess")
-                    break
-
+            async for line in self._iter_lines(self.process.stderr):
                 # Decode and log stderr output
                 stderr_line = line.decode("utf-8", errors="replace").rstrip()
                 if stderr_line:
                     logger.warning(f"UPSTREAM_MCP [stderr] {stderr_line}")
 
+            logger.debug("No more stderr output from subprocess")
+
         except asyncio.CancelledError:
             logger.debug("Stderr logger task cancelled")
             raise
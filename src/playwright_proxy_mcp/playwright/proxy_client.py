@@ -420,14 +420,17 @@ class PlaywrightProxyClient:
         # 90-second timeout for tool calls
         timeout_seconds = 90.0
         try:
-            logger.info(f"UPSTREAM_MCP → Calling tool: {tool_name}")
+            logger.info("UPSTREAM_MCP → Calling tool: %s", tool_name)
 
             # Call tool via FastMCP client with 90-second timeout
             result = await asyncio.wait_for(
                 self._client.call_tool(tool_name, arguments),
                 timeout=timeout_seconds
             )
-            logger.info(f"Raw tool result for {tool_name}: {result}")
+            # Stringifying the raw result (which may hold MBs of base64) is only
+            # worth paying for when debug logging is actually enabled
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Raw tool result for %s: %s", tool_name, result)
 
             # Check for errors (FastMCP Client uses snake_case: is_error)
             if result.is_error:
@@ -441,7 +444,7 @@ class PlaywrightProxyClient:
             transformed_result = await self.transform_response(tool_name, result)
 
             duration = (time.time() - start_time) * 1000  # ms
-            logger.info(f"UPSTREAM_MCP ← Tool result: {tool_name} ({duration:.2f}ms)")
+            logger.info("UPSTREAM_MCP ← Tool result: %s (%.2fms)", tool_name, duration)
 
             return transformed_result
 
@@ -11,8 +11,11 @@ This server:
 4. Returns blob:// URIs for large binary data (retrieval delegated to MCP Resource Server)
 """
 
+import asyncio
 import sys
-from contextlib import asynccontextmanager
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack, asynccontextmanager
+from contextvars import ContextVar
 from typing import Any
 
 from fastmcp import FastMCP
@@ -25,7 +28,20 @@ from .playwright import (
     load_blob_config,
     load_pool_manager_config,
 )
-from .utils.logging_config import get_logger, log_tool_result, setup_file_logging
+from .types import EvaluationResponse, NavigationResponse
+from .utils.aria_processor import (
+    apply_jmespath_query,
+    flatten_aria_tree,
+    format_output,
+    parse_aria_snapshot,
+)
+from .utils.logging_config import (
+    flush_tool_result_logs,
+    get_logger,
+    log_tool_result,
+    setup_file_logging,
+)
+from .utils.navigation_cache import CacheEntry, NavigationCache
 
 # Configure logging using centralized utility
 setup_file_logging(log_file="logs/playwright-proxy-mcp.log")
@@ -33,33 +49,36 @@ logger = get_logger(__name__)
 
 # Log Python interpreter information at startup
 
-logger.info(f"Python interpreter: {sys.executable}")
-logger.info(f"Python version: {sys.version}")
+logger.info("Python interpreter: %s", sys.executable)
+logger.info("Python version: %s", sys.version)
 
-# Global components
-pool_manager_config = None
-blob_config = None
+# Global components (read by the tool handlers; tests patch these module attributes)
 blob_manager = None
 middleware = None
 pool_manager = None
 navigation_cache = None
 
+# Proxy client leased for the current bulk execution (see _pin_instance_for_bulk)
+_pinned_proxy_client: ContextVar[Any | None] = ContextVar("pinned_proxy_client", default=None)
+
+# Snapshot output formats accepted by browser_navigate/browser_snapshot (lowercase)
+_VALID_OUTPUT_FORMATS = frozenset(("json", "yaml"))
+
 
 @asynccontextmanager
 async def lifespan_context(server):
     """Lifespan context manager for startup and shutdown"""
-    global pool_manager_config, blob_config, blob_manager
-    global middleware, pool_manager, navigation_cache
+    global blob_manager, middleware, pool_manager, navigation_cache
 
     logger.info("Starting Playwright MCP Proxy (v2.0.0 - Browser Pools)...")
 
     try:
-        # Load configuration
+        # Load configuration (only needed while wiring up components)
         pool_manager_config = load_pool_manager_config()
         blob_config = load_blob_config()
 
-        logger.info(f"Blob storage: {blob_config['storage_root']}")
-        logger.info(f"Blob threshold: {blob_config['size_threshold_kb']}KB")
+        logger.info("Blob storage: %s", blob_config["storage_root"])
+        logger.info("Blob threshold: %sKB", blob_config["size_threshold_kb"])
 
         # Initialize blob storage
         blob_manager = PlaywrightBlobManager(blob_config)
@@ -68,16 +87,12 @@ async def lifespan_context(server):
         middleware = BinaryInterceptionMiddleware(blob_manager, blob_config["size_threshold_kb"])
 
         # Initialize navigation cache (global, shared across all pools)
-        from .utils.navigation_cache import NavigationCache
-
         navigation_cache = NavigationCache(default_ttl=300)
 
-        # Initialize pool manager
+        # Initialize pool manager (spawns browser subprocesses) and start the blob
+        # cleanup task concurrently; neither depends on the other
         pool_manager = PoolManager(pool_manager_config, blob_manager, middleware)
-        await pool_manager.initialize()
-
-        # Start blob cleanup task
-        await blob_manager.start_cleanup_task()
+        await asyncio.gather(pool_manager.initialize(), blob_manager.start_cleanup_task())
 
         logger.info("Playwright MCP Proxy started successfully")
 
@@ -85,7 +100,7 @@ async def lifespan_context(server):
         yield
 
     except Exception as e:
-        logger.error(f"Failed to start Playwright MCP Proxy: {e}", exc_info=True)
+        logger.error("Failed to start Playwright MCP Proxy: %s", e, exc_info=True)
         raise
 
     finally:
@@ -102,10 +117,13 @@ async def lifespan_context(server):
                 for pool in pool_manager.pools.values():
                     await pool.stop()
 
+            # Write out tool results still being serialized for the log
+            await flush_tool_result_logs()
+
             logger.info("Playwright MCP Proxy shut down successfully")
 
         except Exception as e:
-            logger.error(f"Error during shutdown: {e}", exc_info=True)
+            logger.error("Error during shutdown: %s", e, exc_info=True)
 
 
 # Initialize the MCP server
@@ -163,11 +181,17 @@ async def _call_playwright_tool(
     Returns:
         Tool result (potentially transformed by middleware)
     """
-    if not pool_manager:
+    # Inside a bulk execution, reuse the instance leased for the whole batch
+    pinned = _pinned_proxy_client.get()
+    if pinned is not None and browser_pool is None and browser_instance is None:
+        return await pinned.call_tool(tool_name, arguments)
+
+    manager = pool_manager
+    if not manager:
         raise RuntimeError("Pool manager not initialized")
 
     # Get the appropriate pool
-    pool = pool_manager.get_pool(browser_pool)
+    pool = manager.get_pool(browser_pool)
 
     # Lease an instance from the pool (RAII pattern via context manager)
     async with pool.lease_instance(browser_instance) as proxy_client:
@@ -175,6 +199,23 @@ async def _call_playwright_tool(
         return await proxy_client.call_tool(tool_name, arguments)
 
 
+def _optional_args(args: dict[str, Any] | None = None, /, **optional: Any) -> dict[str, Any]:
+    """
+    Build upstream tool arguments from optional parameters.
+
+    Parameters left as None are omitted so playwright-mcp applies its own defaults.
+    When a dict of required arguments is given, optional values are added to it
+    in place, so each call builds a single arguments dict.
+    """
+    if args is None:
+        return {name: value for name, value in optional.items() if value is not None}
+
+    for name, value in optional.items():
+        if value is not None:
+            args[name] = value
+    return args
+
+
 # =============================================================================
 # NAVIGATION TOOLS
 # =============================================================================
@@ -183,16 +224,21 @@ async def _call_playwright_tool(
 def _create_navigation_error(
     url: str,
     error: str,
+    *,
     offset: int = 0,
     limit: int = 1000,
     cache_key: str = "",
     output_format: str = "yaml",
 ) -> dict[str, Any]:
-    """Create a navigation error response."""
-    from .types import NavigationResponse
+    """
+    Create a navigation error response.
 
+    Shared by browser_navigate and browser_snapshot (url="") for every failure path,
+    so callers only pass the fields that differ from the defaults.
+    """
     return NavigationResponse(
         success=False,
+        snapshot=None,
         url=url,
         error=error,
         cache_key=cache_key,
@@ -200,11 +246,99 @@ def _create_navigation_error(
         offset=offset,
         limit=limit,
         has_more=False,
-        snapshot=None,
         output_format=output_format,
     )
 
 
+def _extract_text_content(result: Any) -> str | None:
+    """
+    Return the text of the first text item in an MCP response's content list.
+
+    Returns None if the response has no content list or no text item.
+    """
+    if not isinstance(result, dict):
+        return None
+    return next(
+        (
+            item.get("text")
+            for item in result.get("content") or ()
+            if isinstance(item, dict) and item.get("type") == "text"
+        ),
+        None,
+    )
+
+
+class _SnapshotUnavailableError(Exception):
+    """Upstream returned no usable ARIA snapshot; the message is reported as-is."""
+
+
+async def _fetch_aria_snapshot(tool_name: str, args: dict[str, Any], missing_error: str) -> Any:
+    """
+    Call an upstream snapshot-producing tool and parse its ARIA snapshot.
+
+    Raises _SnapshotUnavailableError if the response has no snapshot or it fails to parse.
+    """
+    raw_result = await _call_playwright_tool(tool_name, args)
+
+    # Extract YAML snapshot from response
+    yaml_snapshot = _extract_text_content(raw_result)
+    if not yaml_snapshot:
+        raise _SnapshotUnavailableError(missing_error)
+
+    # Parse YAML snapshot to JSON
+    snapshot_json, parse_errors = parse_aria_snapshot(yaml_snapshot)
+    if parse_errors:
+        raise _SnapshotUnavailableError(f"ARIA snapshot parse errors: {'; '.join(parse_errors)}")
+
+    return snapshot_json
+
+
+def _paginate(result_data: Any, offset: int, limit: int) -> tuple[list[Any], int, bool]:
+    """
+    Slice one page out of a result.
+
+    Non-list results count as a single item, returned only on the first page.
+
+    Returns (page, total_items, has_more).
+    """
+    if isinstance(result_data, list):
+        total = len(result_data)
+        return result_data[offset : offset + limit], total, offset + limit < total
+    return ([result_data] if offset == 0 else []), 1, False
+
+
+def _derive_snapshot_data(
+    snapshot_json: Any,
+    entry: CacheEntry | None,
+    flatten: bool,
+    jmespath_query: str | None,
+) -> tuple[Any, str | None]:
+    """
+    Flatten and/or query a snapshot, reusing the result memoized on its cache entry.
+
+    Flattening runs before the JMESPath query so queries can filter on _depth,
+    _parent_role, etc.
+
+    Returns (result_data, error message or None).
+    """
+    if not flatten and not jmespath_query:
+        return snapshot_json, None
+
+    derived_key = (flatten, jmespath_query)
+    if entry is not None and derived_key in entry.derived:
+        return entry.derived[derived_key], None
+
+    result_data = flatten_aria_tree(snapshot_json) if flatten else snapshot_json
+    if jmespath_query:
+        result_data, query_error = apply_jmespath_query(result_data, jmespath_query)
+        if query_error:
+            return None, query_error
+
+    if entry is not None:
+        entry.store_derived(derived_key, result_data)
+    return result_data, None
+
+
 def _validate_navigation_params(
     output_format: str,
     offset: int,
@@ -212,26 +346,27 @@ def _validate_navigation_params(
     flatten: bool,
     jmespath_query: str | None,
     cache_key: str | None,
-) -> str | None:
+) -> tuple[str, str | None]:
     """
     Validate navigation parameters.
 
-    Returns error message if validation fails, None if valid.
+    Returns (output_format lowercased, error message); the error is None if valid.
     """
-    if output_format.lower() not in ["json", "yaml"]:
-        return "output_format must be 'json' or 'yaml'"
+    output_format = output_format.lower()
+    if output_format not in _VALID_OUTPUT_FORMATS:
+        return output_format, "output_format must be 'json' or 'yaml'"
 
     if offset < 0:
-        return "offset must be non-negative"
+        return output_format, "offset must be non-negative"
 
     if limit < 1 or limit > 10000:
-        return "limit must be between 1 and 10000"
+        return output_format, "limit must be between 1 and 10000"
 
     # Validate pagination requires flatten, JMESPath query, or cache_key
     if (offset > 0 or limit != 1000) and not flatten and not jmespath_query and not cache_key:
-        return "Pagination (offset/limit) requires flatten=True, jmespath_query, or cache_key. ARIA snapshots are single tree structures without flattening or queries."
+        return output_format, "Pagination (offset/limit) requires flatten=True, jmespath_query, or cache_key. ARIA snapshots are single tree structures without flattening or queries."
 
-    return None
+    return output_format, None
 
 
 @mcp.tool()
@@ -383,26 +518,24 @@ async def browser_navigate(
         - browser_snapshot: Capture snapshot without navigation
         - browser_take_screenshot: Visual screenshot instead of ARIA tree
     """
-    from .types import NavigationResponse
-    from .utils.aria_processor import (
-        apply_jmespath_query,
-        flatten_aria_tree,
-        format_output,
-        parse_aria_snapshot,
-    )
-
     # Check if navigation_cache is initialized
     if navigation_cache is None:
         return _create_navigation_error(
-            url, "Navigation cache not initialized", offset, limit, "", output_format
+            url,
+            "Navigation cache not initialized",
+            offset=offset,
+            limit=limit,
+            output_format=output_format,
         )
 
     # Validate parameters
-    validation_error = _validate_navigation_params(
+    output_format, validation_error = _validate_navigation_params(
         output_format, offset, limit, flatten, jmespath_query, cache_key
     )
     if validation_error:
-        return _create_navigation_error(url, validation_error, offset, limit, "", output_format)
+        return _create_navigation_error(
+            url, validation_error, offset=offset, limit=limit, output_format=output_format
+        )
 
     # Silent mode: just navigate, no processing
     if silent_mode:
@@ -410,95 +543,57 @@ async def browser_navigate(
             await _call_playwright_tool("browser_navigate", {"url": url})
             return NavigationResponse(
                 success=True,
+                snapshot=None,
                 url=url,
                 cache_key="",
                 total_items=0,
                 offset=0,
                 limit=limit,
                 has_more=False,
-                snapshot=None,
                 error=None,
                 output_format=output_format,
             )
         except Exception as e:
-            return _create_navigation_error(url, f"Navigation failed: {e}", 0, limit, "", output_format)
-
-    # Get or fetch snapshot data
-    snapshot_json = None
-    key = ""
+            return _create_navigation_error(
+                url, f"Navigation failed: {e}", limit=limit, output_format=output_format
+            )
 
+    # Reuse the cached snapshot, or navigate and parse a fresh one
+    # (concurrent misses on the same cache_key and url share a single navigation)
     try:
-        if cache_key:
-            # Try to reuse cached snapshot
-            entry = navigation_cache.get(cache_key)
-            if entry:
-                snapshot_json = entry.snapshot_json
-                key = cache_key
-            # If cache miss, fetch fresh (continue below)
-
-        # Fetch fresh if no cache or cache miss
-        if snapshot_json is None:
-            # Call playwright-mcp browser_navigate
-            raw_result = await _call_playwright_tool("browser_navigate", {"url": url})
-
-            # Extract YAML snapshot from response
-            yaml_snapshot = None
-            if isinstance(raw_result, dict) and "content" in raw_result:
-                for item in raw_result["content"]:
-                    if isinstance(item, dict) and item.get("type") == "text":
-                        yaml_snapshot = item.get("text")
-                        break
-
-            if not yaml_snapshot:
-                return _create_navigation_error(
-                    url, "No ARIA snapshot found in navigation response", offset, limit, "", output_format
-                )
-
-            # Parse YAML snapshot to JSON
-            snapshot_json, parse_errors = parse_aria_snapshot(yaml_snapshot)
-
-            if parse_errors:
-                return _create_navigation_error(
-                    url, f"ARIA snapshot parse errors: {'; '.join(parse_errors)}", offset, limit, "", output_format
-                )
-
-            # Store in cache
-            key = navigation_cache.create(url, snapshot_json)
-
+        key, entry = await navigation_cache.get_or_create(
+            cache_key,
+            url,
+            lambda: _fetch_aria_snapshot(
+                "browser_navigate",
+                {"url": url},
+                "No ARIA snapshot found in navigation response",
+            ),
+        )
+    except _SnapshotUnavailableError as e:
+        return _create_navigation_error(
+            url, str(e), offset=offset, limit=limit, output_format=output_format
+        )
     except Exception as e:
-        return _create_navigation_error(url, f"Navigation failed: {e}", offset, limit, "", output_format)
-
-    # Apply flattening if requested
-    # Flatten before JMESPath query so queries can filter on _depth, _parent_role, etc.
-    if flatten:
-        result_data = flatten_aria_tree(snapshot_json)
-    else:
-        result_data = snapshot_json
+        return _create_navigation_error(
+            url, f"Navigation failed: {e}", offset=offset, limit=limit, output_format=output_format
+        )
+    snapshot_json = entry.snapshot_json
 
-    # Apply JMESPath query if provided
-    if jmespath_query:
-        result_data, query_error = apply_jmespath_query(result_data, jmespath_query)
-        if query_error:
-            return _create_navigation_error(url, query_error, offset, limit, key, output_format)
+    # Apply flattening and JMESPath query (memoized per cache entry)
+    result_data, query_error = _derive_snapshot_data(snapshot_json, entry, flatten, jmespath_query)
+    if query_error:
+        return _create_navigation_error(
+            url,
+            query_error,
+            offset=offset,
+            limit=limit,
+            cache_key=key,
+            output_format=output_format,
+        )
 
     # Handle pagination - wrap non-list in array for consistency
-    paginated_data = None
-    total = 0
-    has_more = False
-
-    if isinstance(result_data, list):
-        total = len(result_data)
-        paginated_data = result_data[offset : offset + limit]
-        has_more = offset + limit < total
-    else:
-        # Single result - wrap in array
-        result_data = [result_data]
-        total = 1
-        if offset == 0:
-            paginated_data = result_data
-        else:
-            paginated_data = []  # offset beyond single result
-        has_more = False
+    paginated_data, total, has_more = _paginate(result_data, offset, limit)
 
     # Format output
     formatted_output = format_output(paginated_data, output_format)
@@ -506,15 +601,15 @@ async def browser_navigate(
     # Return response
     return NavigationResponse(
         success=True,
+        snapshot=formatted_output,
         url=url,
         cache_key=key,
         total_items=total,
         offset=offset,
         limit=limit,
         has_more=has_more,
-        snapshot=formatted_output,
         error=None,
-        output_format=output_format.lower(),
+        output_format=output_format,
     )
 
 
@@ -535,6 +630,42 @@ async def browser_navigate_back() -> dict[str, Any]:
 # =============================================================================
 
 
+@asynccontextmanager
+async def _pin_instance_for_bulk() -> AsyncIterator[None]:
+    """
+    Lease one browser instance from the default pool for a whole bulk execution.
+
+    Every command then runs against the same browser, so refs from an in-batch
+    snapshot stay valid, and the batch pays for one lease instead of one per command.
+    Without a usable default pool, or if no instance can be leased up front,
+    commands lease (and report errors) individually.
+    """
+    manager = pool_manager
+    if not manager or _pinned_proxy_client.get() is not None:
+        yield
+        return
+
+    try:
+        pool = manager.get_pool(None)
+    except ValueError:
+        yield
+        return
+
+    async with AsyncExitStack() as stack:
+        try:
+            proxy_client = await stack.enter_async_context(pool.lease_instance(None))
+        except Exception as e:
+            # e.g. no healthy instance or a lease timeout; None leaves commands unpinned
+            logger.warning("Could not lease an instance for bulk execution: %s", e)
+            proxy_client = None
+
+        token = _pinned_proxy_client.set(proxy_client)
+        try:
+            yield
+        finally:
+            _pinned_proxy_client.reset(token)
+
+
 @mcp.tool()
 @log_tool_result(logger)
 async def browser_execute_bulk(
@@ -615,6 +746,8 @@ async def browser_execute_bulk(
         - If stop_on_error=False, all commands execute and errors are collected
 
     Performance Notes:
+        - All commands run on one browser instance leased for the whole batch,
+          so refs from an earlier browser_snapshot remain valid in later commands
         - Use silent_mode=True on navigation to skip large ARIA snapshots
         - Set return_result=True only on final/critical commands
         - Consider pagination for large result sets
@@ -660,91 +793,40 @@ async def browser_execute_bulk(
                 "stopped_at": None,
             }
 
-    # Map tool names to their wrapper functions
-    # This ensures all custom logic (JMESPath, pagination, blob handling, etc.) is executed
-    # Note: We need to access .fn to get the actual function from FunctionTool wrappers
-    tool_registry = {
-        # Navigation tools
-        "browser_navigate": browser_navigate.fn,
-        "browser_navigate_back": browser_navigate_back.fn,
-        # Snapshot & interaction tools
-        "browser_snapshot": browser_snapshot.fn,
-        "browser_click": browser_click.fn,
-        "browser_drag": browser_drag.fn,
-        "browser_hover": browser_hover.fn,
-        "browser_select_option": browser_select_option.fn,
-        "browser_generate_locator": browser_generate_locator.fn,
-        # Form interaction tools
-        "browser_fill_form": browser_fill_form.fn,
-        # Screenshot & PDF tools
-        "browser_take_screenshot": browser_take_screenshot.fn,
-        "browser_pdf_save": browser_pdf_save.fn,
-        # Code execution tools
-        "browser_run_code": browser_run_code.fn,
-        "browser_evaluate": browser_evaluate.fn,
-        # Mouse tools
-        "browser_mouse_move_xy": browser_mouse_move_xy.fn,
-        "browser_mouse_click_xy": browser_mouse_click_xy.fn,
-        "browser_mouse_drag_xy": browser_mouse_drag_xy.fn,
-        # Keyboard tools
-        "browser_press_key": browser_press_key.fn,
-        "browser_type": browser_type.fn,
-        # Wait & timing tools
-        "browser_wait_for": browser_wait_for.fn,
-        # Verification/testing tools
-        "browser_verify_element_visible": browser_verify_element_visible.fn,
-        "browser_verify_text_visible": browser_verify_text_visible.fn,
-        "browser_verify_list_visible": browser_verify_list_visible.fn,
-        "browser_verify_value": browser_verify_value.fn,
-        # Network tools
-        "browser_network_requests": browser_network_requests.fn,
-        # Tab management tools
-        "browser_tabs": browser_tabs.fn,
-        # Console tools
-        "browser_console_messages": browser_console_messages.fn,
-        # Dialog tools
-        "browser_handle_dialog": browser_handle_dialog.fn,
-        # File upload tools
-        "browser_file_upload": browser_file_upload.fn,
-        # Tracing tools
-        "browser_start_tracing": browser_start_tracing.fn,
-        "browser_stop_tracing": browser_stop_tracing.fn,
-        # Installation tools
-        "browser_install": browser_install.fn,
-    }
-
-    # Execute commands sequentially
     results: list[Any | None] = []
     errors: list[str | None] = []
     executed_count = 0
     stopped_at: int | None = None
 
-    for idx, cmd in enumerate(commands):
-        tool_name = cmd["tool"]
-        args = cmd.get("args", {})
-        return_result = cmd.get("return_result", False) or return_all_results
-
-        try:
-            # Try to find wrapper function first
-            if tool_name in tool_registry:
-                # Call wrapper function (preserves JMESPath, pagination, blob handling, etc.)
-                result = await tool_registry[tool_name](**args)
-            else:
-                # Fallback to direct call for any tools not in registry
-                result = await _call_playwright_tool(tool_name, args)
-
-            results.append(result if return_result else None)
-            errors.append(None)
-            executed_count += 1
-        except Exception as e:
-            # Continue silently - store error, null result
-            results.append(None)
-            errors.append(str(e))
-            executed_count += 1
-
-            if stop_on_error:
-                stopped_at = idx
-                break
+    # Execute commands sequentially on a single leased instance
+    async with _pin_instance_for_bulk():
+        for idx, cmd in enumerate(commands):
+            tool_name = cmd["tool"]
+            args = cmd.get("args", {})
+            return_result = cmd.get("return_result", False) or return_all_results
+
+            try:
+                # Try to find wrapper function first
+                tool = _BULK_TOOL_REGISTRY.get(tool_name)
+                if tool is not None:
+                    # Call wrapper function (preserves JMESPath, pagination, blob handling, etc.)
+                    result = await tool.fn(**args)
+                else:
+                    # Fallback to direct call for any tools not in registry
+                    result = await _call_playwright_tool(tool_name, args)
+
+                results.append(result if return_result else None)
+                errors.append(None)
+                executed_count += 1
+            except Exception as e:
+                # Continue silently - store error, null result
+                results.append(None)
+                errors.append(str(e))
+                executed_count += 1
+
+                if stop_on_error:
+                    stopped_at = idx
+                    break
 
     # Fill remaining slots if stopped early
     if stopped_at is not None:
@@ -774,21 +856,22 @@ def _extract_blob_id_from_response(result: Any) -> str | None:
     Handles both dict and Pydantic model responses.
     """
     # Extract content field
-    content = None
     if isinstance(result, dict):
         content = result.get("content")
-    elif hasattr(result, "content"):
-        content = result.content
+    else:
+        content = getattr(result, "content", None)
 
-    # Search for blob item in content list
+    # Search for blob item in content list (one type check per item; the
+    # middleware normally hands us dicts, so that branch comes first)
     if content and isinstance(content, list):
         for item in content:
-            # Handle both dict and object (Pydantic model) items
-            item_type = item.get("type") if isinstance(item, dict) else getattr(item, "type", None)
-            if item_type == "blob":
-                blob_id = item.get("blob_id") if isinstance(item, dict) else getattr(item, "blob_id", None)
-                if blob_id:
+            if isinstance(item, dict):
+                if item.get("type") == "blob" and (blob_id := item.get("blob_id")):
                     return blob_id
+            elif getattr(item, "type", None) == "blob" and (
+                blob_id := getattr(item, "blob_id", None)
+            ):
+                return blob_id
 
     # Fallback: if result is already a string, return it
     if isinstance(result, str):
@@ -797,6 +880,18 @@ def _extract_blob_id_from_response(result: Any) -> str | None:
     return None
 
 
+def _unwrap_blob_result(result: Any, artifact: str) -> str:
+    """
+    Return the blob URI from a binary tool's response.
+
+    Raises RuntimeError naming the artifact if no blob URI is present.
+    """
+    blob_id = _extract_blob_id_from_response(result)
+    if not blob_id:
+        raise RuntimeError(f"Failed to extract blob URI from {artifact} result: {result}")
+    return blob_id
+
+
 @mcp.tool()
 @log_tool_result(logger)
 async def browser_take_screenshot(
@@ -826,23 +921,12 @@ async def browser_take_screenshot(
     Returns:
         Blob URI reference (blob://timestamp-hash.png or blob://timestamp-hash.jpeg)
     """
-    args = {"type": type}
-    if filename is not None:
-        args["filename"] = filename
-    if element is not None:
-        args["element"] = element
-    if ref is not None:
-        args["ref"] = ref
-    if fullPage is not None:
-        args["fullPage"] = fullPage
+    args = _optional_args(
+        {"type": type}, filename=filename, element=element, ref=ref, fullPage=fullPage
+    )
 
     result = await _call_playwright_tool("browser_take_screenshot", args)
-    blob_id = _extract_blob_id_from_response(result)
-
-    if not blob_id:
-        raise RuntimeError(f"Failed to extract blob URI from screenshot result: {result}")
-
-    return blob_id
+    return _unwrap_blob_result(result, "screenshot")
 
 
 @mcp.tool()
@@ -861,17 +945,10 @@ async def browser_pdf_save(filename: str | None = None) -> str:
     Returns:
         Blob URI reference (blob://timestamp-hash.pdf)
     """
-    args = {}
-    if filename is not None:
-        args["filename"] = filename
+    args = _optional_args(filename=filename)
 
     result = await _call_playwright_tool("browser_pdf_save", args)
-    blob_id = _extract_blob_id_from_response(result)
-
-    if not blob_id:
-        raise RuntimeError(f"Failed to extract blob URI from PDF result: {result}")
-
-    return blob_id
+    return _unwrap_blob_result(result, "PDF")
 
 
 # =============================================================================
@@ -903,8 +980,6 @@ def _create_evaluation_error(
     cache_key: str = "",
 ) -> dict[str, Any]:
     """Create an evaluation error response."""
-    from .types import EvaluationResponse
-
     return EvaluationResponse(
         success=False,
         error=error,
@@ -1038,18 +1113,14 @@ async def browser_evaluate(
         - browser_snapshot: Capture ARIA snapshot with JMESPath filtering
         - browser_run_code: Execute arbitrary page automation code
     """
-    from .types import EvaluationResponse
+    # Upstream arguments are the same whether or not pagination is used
+    args = _optional_args({"function": function}, element=element, ref=ref)
 
     # Check if pagination is requested
     using_pagination = offset > 0 or limit != 1000 or cache_key is not None
 
     # Backward compatibility: no pagination
     if not using_pagination:
-        args = {"function": function}
-        if element is not None:
-            args["element"] = element
-        if ref is not None:
-            args["ref"] = ref
         return await _call_playwright_tool("browser_evaluate", args)
 
     # Pagination mode: validate parameters
@@ -1072,12 +1143,6 @@ async def browser_evaluate(
         # Evaluate if not cached
         if result_data is None:
             # Call upstream playwright-mcp
-            args = {"function": function}
-            if element is not None:
-                args["element"] = element
-            if ref is not None:
-                args["ref"] = ref
-
             raw_result = await _call_playwright_tool("browser_evaluate", args)
 
             # Extract result from {"result": ...} format
@@ -1090,18 +1155,7 @@ async def browser_evaluate(
         return _create_evaluation_error(f"Evaluation failed: {e}", offset, limit)
 
     # Wrap non-list results in array for consistent pagination
-    if isinstance(result_data, list):
-        total = len(result_data)
-        paginated_data = result_data[offset : offset + limit]
-        has_more = offset + limit < total
-    else:
-        # Single result - wrap in array
-        total = 1
-        if offset == 0:
-            paginated_data = [result_data]
-        else:
-            paginated_data = []  # offset beyond single result
-        has_more = False
+    paginated_data, total, has_more = _paginate(result_data, offset, limit)
 
     # Return paginated response
     return EvaluationResponse(
@@ -1265,26 +1319,24 @@ async def browser_snapshot(
         args = {"filename": filename}
         return await _call_playwright_tool("browser_snapshot", args)
 
-    from .types import NavigationResponse
-    from .utils.aria_processor import (
-        apply_jmespath_query,
-        flatten_aria_tree,
-        format_output,
-        parse_aria_snapshot,
-    )
-
     # Check if navigation_cache is initialized
     if navigation_cache is None:
         return _create_navigation_error(
-            "", "Navigation cache not initialized", offset, limit, "", output_format
+            "",
+            "Navigation cache not initialized",
+            offset=offset,
+            limit=limit,
+            output_format=output_format,
         )
 
     # Validate parameters
-    validation_error = _validate_navigation_params(
+    output_format, validation_error = _validate_navigation_params(
         output_format, offset, limit, flatten, jmespath_query, cache_key
     )
     if validation_error:
-        return _create_navigation_error("", validation_error, offset, limit, "", output_format)
+        return _create_navigation_error(
+            "", validation_error, offset=offset, limit=limit, output_format=output_format
+        )
 
     # Silent mode: just capture, no processing
     if silent_mode:
@@ -1292,95 +1344,55 @@ async def browser_snapshot(
             await _call_playwright_tool("browser_snapshot", {})
             return NavigationResponse(
                 success=True,
+                snapshot=None,
                 url="",
                 cache_key="",
                 total_items=0,
                 offset=0,
                 limit=limit,
                 has_more=False,
-                snapshot=None,
                 error=None,
                 output_format=output_format,
             )
         except Exception as e:
-            return _create_navigation_error("", f"Snapshot failed: {e}", 0, limit, "", output_format)
-
-    # Get or fetch snapshot data
-    snapshot_json = None
-    key = ""
+            return _create_navigation_error(
+                "", f"Snapshot failed: {e}", limit=limit, output_format=output_format
+            )
 
+    # Reuse the cached snapshot, or capture and parse a fresh one (use empty URL
+    # for snapshots; concurrent misses on the same cache_key share a single capture)
     try:
-        if cache_key:
-            # Try to reuse cached snapshot
-            entry = navigation_cache.get(cache_key)
-            if entry:
-                snapshot_json = entry.snapshot_json
-                key = cache_key
-            # If cache miss, fetch fresh (continue below)
-
-        # Fetch fresh if no cache or cache miss
-        if snapshot_json is None:
-            # Call playwright-mcp browser_snapshot
-            raw_result = await _call_playwright_tool("browser_snapshot", {})
-
-            # Extract YAML snapshot from response
-            yaml_snapshot = None
-            if isinstance(raw_result, dict) and "content" in raw_result:
-                for item in raw_result["content"]:
-                    if isinstance(item, dict) and item.get("type") == "text":
-                        yaml_snapshot = item.get("text")
-                        break
-
-            if not yaml_snapshot:
-                return _create_navigation_error(
-                    "", "No ARIA snapshot found in response", offset, limit, "", output_format
-                )
-
-            # Parse YAML snapshot to JSON
-            snapshot_json, parse_errors = parse_aria_snapshot(yaml_snapshot)
-
-            if parse_errors:
-                return _create_navigation_error(
-                    "", f"ARIA snapshot parse errors: {'; '.join(parse_errors)}", offset, limit, "", output_format
-                )
-
-            # Store in cache (use empty URL for snapshots)
-            key = navigation_cache.create("", snapshot_json)
-
+        key, entry = await navigation_cache.get_or_create(
+            cache_key,
+            "",
+            lambda: _fetch_aria_snapshot(
+                "browser_snapshot", {}, "No ARIA snapshot found in response"
+            ),
+        )
+    except _SnapshotUnavailableError as e:
+        return _create_navigation_error(
+            "", str(e), offset=offset, limit=limit, output_format=output_format
+        )
     except Exception as e:
-        return _create_navigation_error("", f"Snapshot failed: {e}", offset, limit, "", output_format)
-
-    # Apply flattening if requested
-    # Flatten before JMESPath query so queries can filter on _depth, _parent_role, etc.
-    if flatten:
-        result_data = flatten_aria_tree(snapshot_json)
-    else:
-        result_data = snapshot_json
+        return _create_navigation_error(
+            "", f"Snapshot failed: {e}", offset=offset, limit=limit, output_format=output_format
+        )
+    snapshot_json = entry.snapshot_json
 
-    # Apply JMESPath query if provided
-    if jmespath_query:
-        result_data, query_error = apply_jmespath_query(result_data, jmespath_query)
-        if query_error:
-            return _create_navigation_error("", query_error, offset, limit, key, output_format)
+    # Apply flattening and JMESPath query (memoized per cache entry)
+    result_data, query_error = _derive_snapshot_data(snapshot_json, entry, flatten, jmespath_query)
+    if query_error:
+        return _create_navigation_error(
+            "",
+            query_error,
+            offset=offset,
+            limit=limit,
+            cache_key=key,
+            output_format=output_format,
+        )
 
     # Handle pagination - wrap non-list in array for consistency
-    paginated_data = None
-    total = 0
-    has_more = False
-
-    if isinstance(result_data, list):
-        total = len(result_data)
-        paginated_data = result_data[offset : offset + limit]
-        has_more = offset + limit < total
-    else:
-        # Single result - wrap in array
-        result_data = [result_data]
-        total = 1
-        if offset == 0:
-            paginated_data = result_data
-        else:
-            paginated_data = []  # offset beyond single result
-        has_more = False
+    paginated_data, total, has_more = _paginate(result_data, offset, limit)
 
     # Format output
     formatted_output = format_output(paginated_data, output_format)
@@ -1388,15 +1400,15 @@ async def browser_snapshot(
     # Return response
     return NavigationResponse(
         success=True,
+        snapshot=formatted_output,
         url="",
         cache_key=key,
         total_items=total,
         offset=offset,
         limit=limit,
         has_more=has_more,
-        snapshot=formatted_output,
         error=None,
-        output_format=output_format.lower(),
+        output_format=output_format,
     )
 
 
@@ -1422,13 +1434,12 @@ async def browser_click(
     Returns:
         Click result
     """
-    args = {"element": element, "ref": ref}
-    if doubleClick is not None:
-        args["doubleClick"] = doubleClick
-    if button is not None:
-        args["button"] = button
-    if modifiers is not None:
-        args["modifiers"] = modifiers
+    args = _optional_args(
+        {"element": element, "ref": ref},
+        doubleClick=doubleClick,
+        button=button,
+        modifiers=modifiers,
+    )
 
     return await _call_playwright_tool("browser_click", args)
 
@@ -1660,11 +1671,9 @@ async def browser_type(
     Returns:
         Type result
     """
-    args = {"element": element, "ref": ref, "text": text}
-    if submit is not None:
-        args["submit"] = submit
-    if slowly is not None:
-        args["slowly"] = slowly
+    args = _optional_args(
+        {"element": element, "ref": ref, "text": text}, submit=submit, slowly=slowly
+    )
 
     return await _call_playwright_tool("browser_type", args)
 
@@ -1693,13 +1702,7 @@ async def browser_wait_for(
         Wait result
     """
     # With stdio transport, no need to chunk waits - no ping timeout issue
-    args = {}
-    if time is not None:
-        args["time"] = time
-    if text is not None:
-        args["text"] = text
-    if textGone is not None:
-        args["textGone"] = textGone
+    args = _optional_args(time=time, text=text, textGone=textGone)
 
     return await _call_playwright_tool("browser_wait_for", args)
 
@@ -1819,9 +1822,7 @@ async def browser_tabs(action: str, index: int | None = None) -> dict[str, Any]:
     Returns:
         Tab operation result
     """
-    args = {"action": action}
-    if index is not None:
-        args["index"] = index
+    args = _optional_args({"action": action}, index=index)
 
     return await _call_playwright_tool("browser_tabs", args)
 
@@ -1865,9 +1866,7 @@ async def browser_handle_dialog(accept: bool, promptText: str | None = None) ->
     Returns:
         Dialog handling result
     """
-    args = {"accept": accept}
-    if promptText is not None:
-        args["promptText"] = promptText
+    args = _optional_args({"accept": accept}, promptText=promptText)
 
     return await _call_playwright_tool("browser_handle_dialog", args)
 
@@ -1890,9 +1889,7 @@ async def browser_file_upload(paths: list[str] | None = None) -> dict[str, Any]:
     Returns:
         File upload result
     """
-    args = {}
-    if paths is not None:
-        args["paths"] = paths
+    args = _optional_args(paths=paths)
 
     return await _call_playwright_tool("browser_file_upload", args)
 
@@ -1943,6 +1940,64 @@ async def browser_install() -> dict[str, Any]:
     return await _call_playwright_tool("browser_install", {})
 
 
+# =============================================================================
+# BULK EXECUTION REGISTRY
+# =============================================================================
+
+# Tool name -> registered tool, resolved once at import for browser_execute_bulk.
+# Dispatch goes through each tool's .fn at call time so all custom logic
+# (JMESPath, pagination, blob handling, etc.) is executed.
+_BULK_TOOL_REGISTRY = {
+    # Navigation tools
+    "browser_navigate": browser_navigate,
+    "browser_navigate_back": browser_navigate_back,
+    # Snapshot & interaction tools
+    "browser_snapshot": browser_snapshot,
+    "browser_click": browser_click,
+    "browser_drag": browser_drag,
+    "browser_hover": browser_hover,
+    "browser_select_option": browser_select_option,
+    "browser_generate_locator": browser_generate_locator,
+    # Form interaction tools
+    "browser_fill_form": browser_fill_form,
+    # Screenshot & PDF tools
+    "browser_take_screenshot": browser_take_screenshot,
+    "browser_pdf_save": browser_pdf_save,
+    # Code execution tools
+    "browser_run_code": browser_run_code,
+    "browser_evaluate": browser_evaluate,
+    # Mouse tools
+    "browser_mouse_move_xy": browser_mouse_move_xy,
+    "browser_mouse_click_xy": browser_mouse_click_xy,
+    "browser_mouse_drag_xy": browser_mouse_drag_xy,
+    # Keyboard tools
+    "browser_press_key": browser_press_key,
+    "browser_type": browser_type,
+    # Wait & timing tools
+    "browser_wait_for": browser_wait_for,
+    # Verification/testing tools
+    "browser_verify_element_visible": browser_verify_element_visible,
+    "browser_verify_text_visible": browser_verify_text_visible,
+    "browser_verify_list_visible": browser_verify_list_visible,
+    "browser_verify_value": browser_verify_value,
+    # Network tools
+    "browser_network_requests": browser_network_requests,
+    # Tab management tools
+    "browser_tabs": browser_tabs,
+    # Console tools
+    "browser_console_messages": browser_console_messages,
+    # Dialog tools
+    "browser_handle_dialog": browser_handle_dialog,
+    # File upload tools
+    "browser_file_upload": browser_file_upload,
+    # Tracing tools
+    "browser_start_tracing": browser_start_tracing,
+    "browser_stop_tracing": browser_stop_tracing,
+    # Installation tools
+    "browser_install": browser_install,
+}
+
+
 # =============================================================================
 # POOL MANAGEMENT TOOLS
 # =============================================================================
@@ -54,14 +54,15 @@ class NavigationResponse(TypedDict, total=False):
     pagination, and output formatting.
     """
 
+    # Snapshot leads so the large payload starts the serialized response
     success: bool
+    snapshot: str | None | dict[str, Any]
     url: str
     cache_key: str
     total_items: int
     offset: int
     limit: int
     has_more: bool
-    snapshot: str | None | dict[str, Any]
     error: str | None
     output_format: str
 
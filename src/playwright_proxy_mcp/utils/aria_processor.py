@@ -4,15 +4,49 @@ ARIA Snapshot Processor
 Processes ARIA snapshots: parsing, querying, and formatting.
 """
 
+import hashlib
+import re
+import sys
+from collections import OrderedDict
 from typing import Any
 
 import mistune
+import orjson
 import yaml
 
 from aria_snapshot_parser import AriaSnapshotParser, AriaSnapshotSerializer
 
 from .jmespath_extensions import search_with_custom_functions
 
+# Built once and reused: parse() resets its error list on every call and runs
+# synchronously, so one instance can serve every snapshot on the event loop
+_PARSER = AriaSnapshotParser()
+_SERIALIZER = AriaSnapshotSerializer()
+
+# Parsed snapshots keyed by a digest of their YAML text; agents often resubmit identical
+# snapshots, and the key changes whenever the text does, so entries never go stale
+_PARSE_CACHE_SIZE = 64
+_PARSE_CACHE: OrderedDict[bytes, tuple[Any, list[str]]] = OrderedDict()
+
+# libyaml-backed dumper when PyYAML was built with it; the pure-Python one otherwise
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Plain field equality filter (e.g. [?role == 'button'] or [?role == `"button"`]),
+# the most common snapshot query
+_FIELD_FILTER_QUERY = re.compile(
+    r"\[\?\s*([A-Za-z_][A-Za-z0-9_]*)\s*==\s*(?:'([^'\\]*)'|`([^`\\]*)`)\s*\]"
+)
+
+# Built once and reused instead of per snapshot; each call parses with fresh state
+_MARKDOWN = mistune.create_markdown(renderer='ast')
+
+# Fallback scan for unfenced snapshots: the first list item line, then the first later
+# line that ends the block (a bare closing fence, or unindented text that isn't a list item)
+_YAML_LIST_START = re.compile(r"^[^\S\n]*- ", re.MULTILINE)
+_YAML_BLOCK_END = re.compile(
+    r"\n(?:[^\S\n]*```[^\S\n]*(?![^\n])|(?!  |\t)[^\S\n]*(?!- [^\S\n]*\S)\S)"
+)
+
 
 def parse_aria_snapshot(yaml_text: str) -> tuple[Any, list[str]]:
     """
@@ -25,13 +59,21 @@ def parse_aria_snapshot(yaml_text: str) -> tuple[Any, list[str]]:
         Tuple of (json_data, error_messages)
         - json_data: Parsed snapshot as JSON-serializable data, or None if parse failed
         - error_messages: List of error messages (empty if successful)
+
+        Results are memoized by content, so identical snapshots return the same
+        json_data object; callers must treat it as read-only.
     """
     try:
         # Extract YAML from markdown if wrapped in code fence
         cleaned_yaml = _extract_yaml_from_markdown(yaml_text)
 
-        parser = AriaSnapshotParser()
-        tree, errors = parser.parse(cleaned_yaml)
+        key = hashlib.blake2b(cleaned_yaml.encode(), digest_size=16).digest()
+        cached = _PARSE_CACHE.get(key)
+        if cached is not None:
+            _PARSE_CACHE.move_to_end(key)
+            return cached
+
+        tree, errors = _PARSER.parse(cleaned_yaml)
 
         if errors:
             error_messages = []
@@ -40,11 +82,14 @@ def parse_aria_snapshot(yaml_text: str) -> tuple[Any, list[str]]:
                     error_messages.append(f"Line {e.line}: {e.message}")
                 else:
                     error_messages.append(e.message)
-            return None, error_messages
+            result: tuple[Any, list[str]] = (None, error_messages)
+        else:
+            result = (_SERIALIZER.to_dict(tree), [])
 
-        serializer = AriaSnapshotSerializer()
-        json_data = serializer.to_dict(tree)
-        return json_data, []
+        _PARSE_CACHE[key] = result
+        if len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+            _PARSE_CACHE.popitem(last=False)
+        return result
 
     except Exception as e:
         return None, [f"Failed to parse ARIA snapshot: {e}"]
@@ -73,8 +118,7 @@ def _extract_yaml_from_markdown(text: str) -> str:
 
     # Try to extract from markdown code blocks
     try:
-        markdown = mistune.create_markdown(renderer='ast')
-        ast = markdown(text)
+        ast = _MARKDOWN(text)
 
         # Look for code blocks with yaml/yml language
         for node in ast:
@@ -93,31 +137,17 @@ def _extract_yaml_from_markdown(text: str) -> str:
 
     # Fallback: Look for YAML list starting with "- "
     # Skip any preamble text that doesn't start with "- "
-    lines = text.split('\n')
-    for i, line in enumerate(lines):
-        stripped = line.lstrip()
-        if stripped.startswith('- '):
-            # Found start of YAML, collect until we hit a closing fence or end
-            yaml_lines = []
-            for j in range(i, len(lines)):
-                line_content = lines[j].strip()
-                # Stop if we hit a closing fence
-                if line_content == '```':
-                    break
-                # Stop if we encounter a line that doesn't look like YAML
-                # (empty lines are OK, as are lines starting with "- " or indented content)
-                if line_content and not (
-                    line_content.startswith('- ') or
-                    lines[j].startswith('  ') or  # indented (child element)
-                    lines[j].startswith('\t')     # tab-indented
-                ):
-                    # Check if it's a continuation or if we've left the YAML block
-                    # If the line doesn't start with whitespace and isn't a list item, we're done
-                    if j > i:  # Only stop if we've collected at least one line
-                        break
-                yaml_lines.append(lines[j])
-            if yaml_lines:
-                return '\n'.join(yaml_lines)
+    start = _YAML_LIST_START.search(text)
+    if start:
+        # Collect until a closing fence or a line that doesn't look like YAML
+        # (empty lines are OK, as are lines starting with "- " or indented content)
+        first_line_end = text.find('\n', start.start())
+        if first_line_end == -1:
+            return text[start.start():]
+        stop = _YAML_BLOCK_END.search(text, first_line_end)
+        if stop is None:
+            return text[start.start():]
+        return text[start.start():stop.start()]
 
     # If no YAML list found, return original (will likely fail parsing)
     return text
@@ -136,6 +166,19 @@ def apply_jmespath_query(data: Any, expression: str) -> tuple[Any, str | None]:
         - result: Query result (or empty list on error)
         - error_message: Error message if query failed, None otherwise
     """
+    # Fast path: evaluate a plain string equality filter over a list directly
+    # instead of running the JMESPath interpreter over every node
+    if isinstance(data, list) and (match := _FIELD_FILTER_QUERY.fullmatch(expression.strip())):
+        field, raw_string, literal = match.groups()
+        value = raw_string if literal is None else _string_literal(literal)
+        if value is not None:
+            # Parsed roles are interned, so equal roles usually compare by identity
+            value = sys.intern(value)
+            matches = [
+                item for item in data if isinstance(item, dict) and item.get(field) == value
+            ]
+            return matches, None
+
     try:
         result = search_with_custom_functions(expression, data)
         # Return empty list if result is None
@@ -144,23 +187,45 @@ def apply_jmespath_query(data: Any, expression: str) -> tuple[Any, str | None]:
         return ([], f"Invalid JMESPath query: {e}")
 
 
+def _string_literal(literal: str) -> str | None:
+    """
+    Decode a JMESPath backtick literal the way the JMESPath lexer does.
+
+    Args:
+        literal: Text between the backticks
+
+    Returns:
+        The literal's value if it is a string, None otherwise
+    """
+    try:
+        value = orjson.loads(literal)
+    except orjson.JSONDecodeError:
+        # Legacy form: invalid JSON (e.g. `button`) is read as a quoted string
+        try:
+            value = orjson.loads(f'"{literal.lstrip()}"')
+        except orjson.JSONDecodeError:
+            return None
+    return value if isinstance(value, str) else None
+
+
 def flatten_aria_tree(
     node: dict | list,
     depth: int = 0,
     parent_role: str | None = None,
-    index_counter: list[int] | None = None
 ) -> list[dict]:
     """
     Flatten ARIA tree to depth-first list of nodes.
 
     Converts hierarchical ARIA snapshot into a flat list where each node
     is a standalone dict with metadata about its position in the tree.
+    Walks the tree with an explicit stack, so deep snapshots cost no Python
+    recursion and no intermediate per-subtree lists. Nodes are shallow-copied;
+    the (possibly cached) source tree is never modified.
 
     Args:
         node: ARIA tree (dict) or root array (list)
-        depth: Current nesting level (0 = root)
-        parent_role: Role of parent node (for context)
-        index_counter: Mutable list containing current index (internal use)
+        depth: Nesting level of node (0 = root)
+        parent_role: Role of the parent of node (for context)
 
     Returns:
         Flat list of nodes with added metadata fields:
@@ -176,36 +241,30 @@ def flatten_aria_tree(
             {"role": "button", "_depth": 1, "_parent_role": "document", "_index": 1}
         ]
     """
-    if index_counter is None:
-        index_counter = [0]
-
-    result = []
-
-    if isinstance(node, list):
-        # Process array of nodes
-        for item in node:
-            result.extend(flatten_aria_tree(item, depth, parent_role, index_counter))
-
-    elif isinstance(node, dict):
-        # Create copy of current node without children
-        node_copy = {**node}
-
-        # Extract children before adding metadata
-        children = node_copy.pop('children', None)
-
-        # Add metadata
-        node_copy['_depth'] = depth
-        node_copy['_parent_role'] = parent_role
-        node_copy['_index'] = index_counter[0]
-        index_counter[0] += 1
-
-        # Add current node to result
-        result.append(node_copy)
-
-        # Recursively flatten children
-        if children:
-            current_role = node.get('role')
-            result.extend(flatten_aria_tree(children, depth + 1, current_role, index_counter))
+    result: list[dict] = []
+    stack: list[tuple[Any, int, str | None]] = [(node, depth, parent_role)]
+    push = stack.append
+    pop = stack.pop
+
+    while stack:
+        current, current_depth, current_parent = pop()
+
+        if isinstance(current, list):
+            # Push in reverse so items are visited in document order
+            for item in reversed(current):
+                push((item, current_depth, current_parent))
+
+        elif isinstance(current, dict):
+            # Copy current node without children, then add metadata
+            node_copy = current.copy()
+            children = node_copy.pop("children", None)
+            node_copy["_depth"] = current_depth
+            node_copy["_parent_role"] = current_parent
+            node_copy["_index"] = len(result)
+            result.append(node_copy)
+
+            if children:
+                push((children, current_depth + 1, current.get("role")))
 
     return result
 
@@ -221,7 +280,8 @@ def format_output(data: dict[str, Any], output_format: str) -> str | list[dict[s
     Returns:
         Formatted string or raw data
     """
-    if output_format.lower() == "json":
+    # Callers normally pass the lowercase literal; only fold case when they don't
+    if output_format == "json" or (output_format != "yaml" and output_format.lower() == "json"):
         return data
     else:  # yaml (default)
-        return yaml.dump(data, default_flow_style=False, allow_unicode=True)
+        return yaml.dump(data, Dumper=_YAML_DUMPER, default_flow_style=False, allow_unicode=True)
@@ -6,6 +6,7 @@ Based on partsbox_mcp reference implementation.
 """
 
 import re
+from functools import lru_cache
 from typing import Any
 
 import jmespath
@@ -99,6 +100,23 @@ class CustomFunctions(functions.Functions):
 _custom_options = jmespath.Options(custom_functions=CustomFunctions())
 
 
+@lru_cache(maxsize=256)
+def compile_expression(expression: str) -> jmespath.parser.ParsedResult:
+    """
+    Compile a JMESPath expression, reusing the result for repeated queries.
+
+    Args:
+        expression: JMESPath expression
+
+    Returns:
+        Compiled expression
+
+    Raises:
+        jmespath.exceptions.ParseError: If the expression is invalid (not cached)
+    """
+    return jmespath.compile(expression)
+
+
 def search_with_custom_functions(expression: str, data: Any) -> Any:
     """
     Search data using JMESPath expression with custom functions.
@@ -110,4 +128,4 @@ def search_with_custom_functions(expression: str, data: Any) -> Any:
     Returns:
         Query result
     """
-    return jmespath.search(expression, data, options=_custom_options)
+    return compile_expression(expression).search(data, options=_custom_options)
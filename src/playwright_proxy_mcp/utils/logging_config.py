@@ -6,12 +6,37 @@ The MCP protocol uses stdout for JSON-RPC communication, so all logging must
 go exclusively to files.
 """
 
+import asyncio
+import atexit
+import concurrent.futures
 import functools
-import json
 import logging
+import logging.handlers
+import queue
+import re
 from pathlib import Path
 from typing import Any, Callable, TypeVar
 
+import orjson
+
+# Rotate the log file at 50 MB, keeping 5 old files
+_MAX_LOG_BYTES = 50 * 1024 * 1024
+_LOG_BACKUP_COUNT = 5
+
+# Keys whose values log_dict masks
+_SENSITIVE_KEY = re.compile("token|password|secret|key", re.IGNORECASE)
+
+# Background thread that writes queued records to the log file
+_queue_listener: logging.handlers.QueueListener | None = None
+
+# Tool results are serialized for the log on these worker threads; once this many are
+# in flight, further results are logged inline so the backlog stays bounded
+_MAX_PENDING_RESULT_LOGS = 4
+_result_log_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=_MAX_PENDING_RESULT_LOGS, thread_name_prefix="tool-result-log"
+)
+_pending_result_logs: set[concurrent.futures.Future[None]] = set()
+
 
 def setup_file_logging(
     log_file: str | Path = "logs/playwright-proxy-mcp.log",
@@ -33,6 +58,8 @@ def setup_file_logging(
     Returns:
         The root logger instance
     """
+    global _queue_listener
+
     # Ensure log directory exists
     log_path = Path(log_file)
     log_path.parent.mkdir(parents=True, exist_ok=True)
@@ -41,12 +68,22 @@ def setup_file_logging(
     if format_string is None:
         format_string = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
+    # Records are formatted by the calling thread and queued; a listener thread does
+    # the (size-rotated) file writes so tool calls never block on disk I/O
+    _stop_queue_listener()
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_path, maxBytes=_MAX_LOG_BYTES, backupCount=_LOG_BACKUP_COUNT, encoding="utf-8"
+    )
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _queue_listener = logging.handlers.QueueListener(log_queue, file_handler)
+    _queue_listener.start()
+
     # Configure root logger
     logging.basicConfig(
         level=level,
         format=format_string,
         handlers=[
-            logging.FileHandler(log_path),
+            logging.handlers.QueueHandler(log_queue),
         ],
         force=True,  # Override any existing configuration
     )
@@ -57,6 +94,21 @@ def setup_file_logging(
     return logger
 
 
+def _stop_queue_listener() -> None:
+    """Flush queued records to the log file and close it."""
+    global _queue_listener
+
+    if _queue_listener is None:
+        return
+    _queue_listener.stop()
+    for handler in _queue_listener.handlers:
+        handler.close()
+    _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for the specified module.
@@ -85,11 +137,42 @@ def log_dict(
     logger.log(level, message)
     for key, value in data.items():
         # Mask sensitive values
-        if any(sensitive in key.lower() for sensitive in ["token", "password", "secret", "key"]):
+        if _SENSITIVE_KEY.search(key):
             value = "***REDACTED***"
         logger.log(level, f"  {key}: {value}")
 
 
+def _emit_tool_result(logger: logging.Logger, tool_name: str, result: Any) -> None:
+    """
+    Serialize a tool result to JSON and log it (runs in a worker thread).
+
+    Args:
+        logger: Logger instance
+        tool_name: Name of the tool that produced the result
+        result: Tool result
+    """
+    try:
+        # Try to serialize to JSON for clean output; passed as a logging
+        # argument so a multi-MB result isn't copied into an f-string too
+        result_json = orjson.dumps(
+            result,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        ).decode()
+        logger.info("TOOL_RESULT [%s]:\n%s", tool_name, result_json)
+    except Exception as e:
+        # Fallback to str representation if JSON serialization fails
+        logger.info("TOOL_RESULT [%s]:\n%s", tool_name, result)
+        logger.warning(f"Failed to serialize result to JSON for {tool_name}: {e}")
+
+
+async def flush_tool_result_logs() -> None:
+    """Wait until every tool result handed to the log has been written."""
+    pending = list(_pending_result_logs)
+    if pending:
+        await asyncio.to_thread(concurrent.futures.wait, pending)
+
+
 # Type variable for the decorator
 F = TypeVar("F", bound=Callable[..., Any])
 
@@ -99,7 +182,9 @@ def log_tool_result(logger: logging.Logger | None = None) -> Callable[[F], F]:
     Decorator to log the full result JSON from tool methods.
 
     This decorator wraps async tool functions and logs their complete result
-    in JSON format. Useful for debugging and tracking tool outputs.
+    in JSON format. Useful for debugging and tracking tool outputs. The result
+    is serialized and logged in a worker thread after the tool returns; await
+    flush_tool_result_logs() to wait for pending log writes.
 
     Args:
         logger: Optional logger instance. If not provided, uses __name__ of decorated function.
@@ -127,15 +212,19 @@ def log_tool_result(logger: logging.Logger | None = None) -> Callable[[F], F]:
             # Call the original function
             result = await func(*args, **kwargs)
 
-            # Log the full result
-            try:
-                # Try to serialize to JSON for clean output
-                result_json = json.dumps(result, default=str, indent=2)
-                logger.info(f"TOOL_RESULT [{tool_name}]:\n{result_json}")
-            except Exception as e:
-                # Fallback to str representation if JSON serialization fails
-                logger.info(f"TOOL_RESULT [{tool_name}]:\n{result}")
-                logger.warning(f"Failed to serialize result to JSON for {tool_name}: {e}")
+            # Log the full result (skip serializing it when INFO is disabled)
+            if not logger.isEnabledFor(logging.INFO):
+                return result
+
+            # Serialize and log in a worker thread so a multi-MB result doesn't hold
+            # up the event loop; the caller gets its result without waiting on it
+            if len(_pending_result_logs) >= _MAX_PENDING_RESULT_LOGS:
+                _emit_tool_result(logger, tool_name, result)
+                return result
+
+            future = _result_log_executor.submit(_emit_tool_result, logger, tool_name, result)
+            _pending_result_logs.add(future)
+            future.add_done_callback(_pending_result_logs.discard)
 
             return result
 
@@ -5,44 +5,78 @@ Manages cached navigation snapshots for pagination.
 Based on partsbox_mcp PaginationCache pattern.
 """
 
+import asyncio
+import heapq
+import logging
 import uuid
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
-from time import time
+from time import monotonic
 from typing import Any
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Per-entry bound on memoized flatten/query results (oldest evicted first)
+MAX_DERIVED_RESULTS = 8
+
+
+@dataclass(slots=True)
 class CacheEntry:
     """Cached navigation snapshot with TTL."""
 
     url: str
     snapshot_json: list[dict] | dict | Any
-    created_at: float = field(default_factory=time)
-    last_accessed: float = field(default_factory=time)
+    # Monotonic clock readings, so wall-clock adjustments never expire or revive entries
+    created_at: float = field(default_factory=monotonic)
+    last_accessed: float = field(default_factory=monotonic)
     ttl: int = 300  # 5 minutes default
+    # Flatten/JMESPath results keyed by (flatten, jmespath_query), so paginating
+    # the same query only slices instead of re-running it on the whole tree
+    derived: dict[tuple[bool, str | None], Any] = field(default_factory=dict)
 
     @property
     def is_expired(self) -> bool:
         """Check if cache entry has expired."""
-        return time() - self.last_accessed > self.ttl
+        return monotonic() - self.last_accessed > self.ttl
 
     def touch(self) -> None:
         """Update last access time."""
-        self.last_accessed = time()
+        self.last_accessed = monotonic()
+
+    def store_derived(self, key: tuple[bool, str | None], result: Any) -> None:
+        """
+        Memoize a flatten/query result for this snapshot.
+
+        Args:
+            key: (flatten, jmespath_query) the result was computed with
+            result: Flattened and/or queried snapshot data
+        """
+        if key not in self.derived and len(self.derived) >= MAX_DERIVED_RESULTS:
+            del self.derived[next(iter(self.derived))]
+        self.derived[key] = result
 
 
 class NavigationCache:
     """Manages cached navigation snapshots for pagination."""
 
-    def __init__(self, default_ttl: int = 300):
+    def __init__(self, default_ttl: int = 300, max_entries: int = 64):
         """
         Initialize navigation cache.
 
         Args:
             default_ttl: Default time-to-live in seconds (default: 300 = 5 minutes)
+            max_entries: Maximum number of cached snapshots; the least recently
+                used entry is evicted when a new one would exceed it (default: 64)
         """
+        # Kept in least- to most-recently-used order
         self._cache: dict[str, CacheEntry] = {}
         self._default_ttl = default_ttl
+        self._max_entries = max_entries
+        # In-flight fetches for missed (key, url) pairs, shared by concurrent callers
+        self._pending: dict[tuple[str, str], asyncio.Future[tuple[str, CacheEntry]]] = {}
+        # Min-heap of (expiry time, key) so cleanup only visits entries that are due;
+        # deadlines go stale when entries are touched or removed and are rechecked on pop
+        self._expiry_heap: list[tuple[float, str]] = []
 
     def create(self, url: str, snapshot_json: Any, ttl: int | None = None) -> str:
         """
@@ -57,11 +91,16 @@ class NavigationCache:
             Cache key for future retrieval
         """
         self._lazy_cleanup()
+        while len(self._cache) >= self._max_entries:
+            evicted = next(iter(self._cache))
+            del self._cache[evicted]
+            logger.debug("Evicted least recently used navigation cache entry %s", evicted)
+
         key = f"nav_{uuid.uuid4().hex[:8]}"
         entry_ttl = ttl if ttl is not None else self._default_ttl
-        self._cache[key] = CacheEntry(
-            url=url, snapshot_json=snapshot_json, ttl=entry_ttl
-        )
+        entry = CacheEntry(url=url, snapshot_json=snapshot_json, ttl=entry_ttl)
+        self._cache[key] = entry
+        heapq.heappush(self._expiry_heap, (entry.last_accessed + entry_ttl, key))
         return key
 
     def get(self, key: str) -> CacheEntry | None:
@@ -84,9 +123,58 @@ class NavigationCache:
             del self._cache[key]
             return None
 
+        # Move to the most-recently-used end
+        del self._cache[key]
+        self._cache[key] = entry
         entry.touch()
         return entry
 
+    async def get_or_create(
+        self,
+        key: str | None,
+        url: str,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> tuple[str, CacheEntry]:
+        """
+        Retrieve a cache entry, fetching and storing a fresh snapshot on a miss.
+
+        Concurrent misses on the same key and URL share a single fetch instead of
+        each re-fetching and re-parsing the snapshot; misses that reuse a key for
+        different URLs fetch separately. Without a key, every call fetches.
+
+        Args:
+            key: Cache key from a previous call, or None to always fetch
+            url: URL the snapshot belongs to
+            fetch: Coroutine factory returning the parsed snapshot; exceptions propagate
+
+        Returns:
+            Tuple of (cache key, CacheEntry); the key is new if the snapshot was fetched
+        """
+        if not key:
+            return await self._fetch_and_store(url, fetch)
+
+        entry = self.get(key)
+        if entry is not None:
+            return key, entry
+
+        pending_key = (key, url)
+        pending = self._pending.get(pending_key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._fetch_and_store(url, fetch))
+            self._pending[pending_key] = pending
+            pending.add_done_callback(lambda _: self._pending.pop(pending_key, None))
+
+        # Shield so one cancelled caller does not cancel the fetch the others await
+        return await asyncio.shield(pending)
+
+    async def _fetch_and_store(
+        self, url: str, fetch: Callable[[], Awaitable[Any]]
+    ) -> tuple[str, CacheEntry]:
+        """Fetch a snapshot and store it under a new key."""
+        snapshot_json = await fetch()
+        key = self.create(url, snapshot_json)
+        return key, self._cache[key]
+
     def delete(self, key: str) -> bool:
         """
         Delete cache entry.
@@ -105,12 +193,25 @@ class NavigationCache:
     def clear(self) -> None:
         """Clear all cache entries."""
         self._cache.clear()
+        self._expiry_heap.clear()
 
     def _lazy_cleanup(self) -> None:
         """Remove expired entries on each access."""
-        expired_keys = [key for key, entry in self._cache.items() if entry.is_expired]
-        for key in expired_keys:
-            del self._cache[key]
+        heap = self._expiry_heap
+        now = monotonic()
+        still_live = []
+        while heap and heap[0][0] <= now:
+            _, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            if entry is None:
+                continue
+            if entry.is_expired:
+                del self._cache[key]
+            else:
+                # Touched since it was scheduled; requeue at its current deadline
+                still_live.append((entry.last_accessed + entry.ttl, key))
+        for item in still_live:
+            heapq.heappush(heap, item)
 
     def __len__(self) -> int:
         """Return number of cached entries."""
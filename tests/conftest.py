@@ -10,7 +10,7 @@ from unittest.mock import AsyncMock, Mock
 import pytest
 
 # Import browser fixtures to make them available to all tests
-from tests.fixtures.browser_fixture import browser_setup  # noqa: F401
+from tests.fixtures.browser_fixture import browser_session, browser_setup  # noqa: F401
 
 
 @pytest.fixture
@@ -89,7 +89,19 @@ def mock_pool_manager(mock_proxy_client):
 @pytest.fixture
 def mock_navigation_cache():
     """Create a mock navigation cache for testing."""
+    from playwright_proxy_mcp.utils.navigation_cache import CacheEntry
+
     mock_cache = Mock()
     mock_cache.get = Mock(return_value=None)
     mock_cache.create = Mock(return_value="nav_test123")
+
+    # Same hit/miss flow as NavigationCache.get_or_create, built on the stubs above
+    async def get_or_create(key, url, fetch):
+        entry = mock_cache.get(key) if key else None
+        if entry is None:
+            entry = CacheEntry(url=url, snapshot_json=await fetch())
+            key = mock_cache.create(url, entry.snapshot_json)
+        return key, entry
+
+    mock_cache.get_or_create = AsyncMock(side_effect=get_or_create)
     return mock_cache
@@ -26,14 +26,18 @@ from playwright_proxy_mcp.playwright.config import BlobConfig
 from playwright_proxy_mcp.utils.navigation_cache import NavigationCache
 
 
-@pytest_asyncio.fixture
-async def browser_setup():
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def browser_session():
     """
-    Set up browser components for integration tests using pool manager (v2.0.0).
+    Set up browser components once for all integration tests using pool manager (v2.0.0).
+
+    Starting the pool launches playwright-mcp and a browser, which dominates the
+    runtime of every integration test, so the instances are shared by the whole
+    session; browser_setup resets per-test state.
 
     This fixture initializes all components needed for browser testing:
     - Temporary directory for blob storage
-    - Blob manager with cleanup task
+    - Blob manager (periodic cleanup disabled)
     - Binary interception middleware
     - Pool manager with single 'ISOLATED' pool for testing
     - Navigation cache for pagination
@@ -51,7 +55,7 @@ async def browser_setup():
             "max_size_mb": 100,
             "ttl_hours": 24,
             "size_threshold_kb": 50,
-            "cleanup_interval_minutes": 60,
+            "cleanup_interval_minutes": 0,  # disabled in tests
         }
 
         # Set up environment variables for pool configuration
@@ -133,3 +137,21 @@ async def browser_setup():
                     os.environ.pop(key, None)
                 else:
                     os.environ[key] = original_value
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def browser_setup(browser_session):
+    """
+    Provide the shared browser components with fresh per-test state.
+
+    Tests using this fixture must run on the session event loop
+    (@pytest.mark.asyncio(loop_scope="session")), since the browser
+    subprocesses belong to it.
+
+    Yields:
+        tuple: (pool_manager, navigation_cache) for tests to use
+    """
+    pool_manager, navigation_cache = browser_session
+    navigation_cache.clear()
+    server.navigation_cache = navigation_cache
+    yield pool_manager, navigation_cache
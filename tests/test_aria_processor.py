@@ -6,12 +6,15 @@ from typing import Any
 import pytest
 
 from playwright_proxy_mcp.utils.aria_processor import (
+    _PARSE_CACHE,
+    _PARSE_CACHE_SIZE,
     _extract_yaml_from_markdown,
     apply_jmespath_query,
     flatten_aria_tree,
     format_output,
     parse_aria_snapshot,
 )
+from playwright_proxy_mcp.utils.jmespath_extensions import search_with_custom_functions
 
 def test_extract_yaml_with_header():
     """Test stripping preamble text before ARIA snapshot."""
@@ -30,6 +33,24 @@ Title: Example Domain
     assert result == expected
 
 
+def test_extract_yaml_stops_at_trailing_text():
+    """Test that unindented prose after the ARIA tree is not included."""
+    text = """Snapshot:
+- list [ref=e1]
+  - listitem "One" [ref=e2]
+
+	- listitem "Two" [ref=e3]
+Console messages: none
+- button "Ignored" [ref=e4]"""
+
+    expected = """- list [ref=e1]
+  - listitem "One" [ref=e2]
+
+	- listitem "Two" [ref=e3]"""
+
+    assert _extract_yaml_from_markdown(text) == expected
+
+
 def test_extract_yaml_with_markdown_fence():
     """Test extracting YAML from markdown code fence."""
     yaml_with_fence = """```yaml
@@ -97,6 +118,44 @@ def test_extract_yaml_unnamed_code_block():
     assert result == expected
 
 
+def test_extract_yaml_skips_other_language_fence():
+    """Test that a fence tagged with another language is not taken as YAML."""
+    text = """```json
+{"a": 1}
+```
+
+```yaml
+- button "Submit" [ref=e1]
+```"""
+
+    result = _extract_yaml_from_markdown(text)
+    assert result == '- button "Submit" [ref=e1]'
+
+
+def test_extract_yaml_skips_other_language_fence_with_prose_between():
+    """Test that the closing fence of another block is not taken as an untagged opening."""
+    text = "Intro\n```python\nx = 1\n```\ntext\n```yaml\n- a\n```"
+
+    result = _extract_yaml_from_markdown(text)
+    assert result == "- a"
+
+
+def test_extract_yaml_tilde_fence():
+    """Test extracting YAML from a tilde fence with a longer closing run."""
+    text = "Snapshot:\n~~~yaml\n- button \"Submit\" [ref=e1]\n~~~~\n"
+
+    result = _extract_yaml_from_markdown(text)
+    assert result == '- button "Submit" [ref=e1]'
+
+
+def test_extract_yaml_ignores_fence_nested_in_list_item():
+    """Test that a fence inside a list item is not taken as the top-level snapshot."""
+    text = "Steps:\n\n- first\n  ```yaml\n  - nested\n  ```\n\n```yaml\n- top\n```"
+
+    result = _extract_yaml_from_markdown(text)
+    assert result == "- top"
+
+
 def test_parse_aria_snapshot_with_preamble():
     """Test parsing ARIA snapshot that has preamble text."""
     yaml_with_preamble = """Page URL: https://www.lcsc.com/product-detail/C107107.html
@@ -127,6 +186,34 @@ def test_parse_aria_snapshot_without_preamble():
     assert len(json_data) == 2
 
 
+def test_parse_aria_snapshot_errors_do_not_leak_between_calls():
+    """Test that errors from one parse are not reported by the next."""
+    json_data, errors = parse_aria_snapshot('- button "Submit" [bogus=1]')
+    assert json_data is None
+    assert errors == ["Unknown attribute: bogus"]
+
+    json_data, errors = parse_aria_snapshot('- button "Submit" [ref=e1]')
+    assert errors == []
+    assert json_data[0]["role"] == "button"
+
+
+def test_parse_aria_snapshot_memoizes_identical_text():
+    """Test that identical snapshot text, fenced or not, reuses the cached parse."""
+    _PARSE_CACHE.clear()
+    first, _ = parse_aria_snapshot('- button "Cached" [ref=e1]')
+    second, _ = parse_aria_snapshot('```yaml\n- button "Cached" [ref=e1]\n```')
+    assert second is first
+    assert len(_PARSE_CACHE) == 1
+
+
+def test_parse_aria_snapshot_cache_is_bounded():
+    """Test that the parse cache evicts its least recently used entries."""
+    _PARSE_CACHE.clear()
+    for i in range(_PARSE_CACHE_SIZE + 5):
+        parse_aria_snapshot(f'- button "B{i}" [ref=e{i}]')
+    assert len(_PARSE_CACHE) == _PARSE_CACHE_SIZE
+
+
 def test_apply_jmespath_query_filter():
     """Test JMESPath query filtering."""
     data = [
@@ -141,6 +228,32 @@ def test_apply_jmespath_query_filter():
     assert len(result) == 2
     assert all(item["role"] == "button" for item in result)
 
+def test_apply_jmespath_query_field_filter_fast_path_matches_jmespath():
+    """Test that the plain equality filter fast path returns what JMESPath returns."""
+    data = [
+        {"role": "button", "name": {"value": "Submit"}},
+        {"role": "link", "name": {"value": "Home"}, "ref": "e2"},
+        "text node",
+        {"name": {"value": "No role"}},
+        {"role": "button", "name": {"value": "Cancel"}},
+        {"role": "true", "level": 1},
+    ]
+
+    queries = (
+        "[?role == 'button']",
+        "[? role=='button' ]",
+        "[?role == '']",
+        "[?ref == 'e2']",
+        '[?role == `"link"`]',
+        "[?role == `true`]",
+        "[?level == `1`]",
+        "[?role == `null`]",
+    )
+    for query in queries:
+        result, error = apply_jmespath_query(data, query)
+        assert error is None
+        assert result == search_with_custom_functions(query, data)
+
 def test_apply_jmespath_query_projection():
     """Test JMESPath query projection."""
     data = [
@@ -172,6 +285,13 @@ def test_format_output_json():
     assert isinstance(result, list)
 
 
+def test_format_output_json_is_case_insensitive():
+    """Test that a mixed-case format name still selects JSON."""
+    data = [{"role": "button", "name": "Submit"}]
+
+    assert format_output(data, "JSON") is data
+
+
 def test_format_output_yaml():
     """Test YAML output formatting."""
     data = [{"role": "button", "name": "Submit"}]
@@ -403,3 +523,20 @@ def test_flatten_aria_tree_text_nodes():
     assert result[1]["value"] == "This is some text."
     assert result[1]["_depth"] == 1
     assert result[1]["_parent_role"] == "paragraph"
+
+
+def test_flatten_deep_tree_without_recursion_limit():
+    """Test flattening a tree deeper than Python's recursion limit."""
+    tree = {"role": "generic"}
+    current = tree
+    for _ in range(5000):
+        child = {"role": "generic"}
+        current["children"] = [child]
+        current = child
+
+    result = flatten_aria_tree([tree])
+
+    assert len(result) == 5001
+    assert result[-1]["_depth"] == 5000
+    assert result[-1]["_index"] == 5000
+    assert "children" in tree  # source tree is not modified
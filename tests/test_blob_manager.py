@@ -9,7 +9,11 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from playwright_proxy_mcp.playwright.blob_manager import PlaywrightBlobManager
+from playwright_proxy_mcp.playwright.blob_manager import (
+    PlaywrightBlobManager,
+    parse_data_uri_header,
+    split_data_uri,
+)
 
 
 @pytest.fixture
@@ -353,6 +357,18 @@ class TestPlaywrightBlobManager:
         # Cleanup
         await manager.stop_cleanup_task()
 
+    @pytest.mark.asyncio
+    async def test_start_cleanup_task_disabled(self, blob_config):
+        """Test that a non-positive interval disables the cleanup task."""
+        blob_config["cleanup_interval_minutes"] = 0
+        manager = PlaywrightBlobManager(blob_config)
+
+        await manager.start_cleanup_task()
+        assert manager._cleanup_task is None
+
+        # Stopping a task that never started is a no-op
+        await manager.stop_cleanup_task()
+
     @pytest.mark.asyncio
     async def test_start_cleanup_task_already_running(self, blob_config):
         """Test starting cleanup task when already running."""
@@ -390,3 +406,27 @@ class TestPlaywrightBlobManager:
         # Should not raise an error
         await manager.stop_cleanup_task()
         assert manager._cleanup_task is None
+
+
+class TestSplitDataUri:
+    """Tests for split_data_uri helper."""
+
+    def test_data_uri(self):
+        assert split_data_uri("data:image/png;base64,iVBORw0K") == ("image/png", "iVBORw0K")
+
+    def test_bare_base64(self):
+        assert split_data_uri("iVBORw0K") == (None, "iVBORw0K")
+
+    def test_header_offset(self):
+        value = "data:application/pdf;base64,JVBERi0x"
+        mime_type, payload_start = parse_data_uri_header(value)
+        assert mime_type == "application/pdf"
+        assert value[payload_start:] == "JVBERi0x"
+        assert parse_data_uri_header("JVBERi0x") == (None, 0)
+
+    @pytest.mark.parametrize(
+        "value",
+        ["data:;base64,abc", "data:image/png,abc", "data:image/png;base64,", "data:image/png"],
+    )
+    def test_malformed_header(self, value):
+        assert split_data_uri(value) == (None, value)
@@ -14,7 +14,7 @@ from playwright_proxy_mcp import server
 
 @pytest.mark.integration
 @pytest.mark.slow
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_browser_navigate_real_website(browser_setup):
     """
     Test browser_navigate against a real website in silent mode.
@@ -51,7 +51,7 @@ async def test_browser_navigate_real_website(browser_setup):
 
 @pytest.mark.integration
 @pytest.mark.slow
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_browser_navigate_multiple_pages(browser_setup):
     """
     Test browser_navigate to multiple pages.
@@ -87,7 +87,7 @@ async def test_browser_navigate_multiple_pages(browser_setup):
 
 @pytest.mark.integration
 @pytest.mark.slow
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_browser_navigate_silent_mode_real_website(browser_setup):
     """
     Test browser_navigate with silent mode against a real website.
@@ -118,7 +118,7 @@ async def test_browser_navigate_silent_mode_real_website(browser_setup):
 
 @pytest.mark.integration
 @pytest.mark.slow
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_browser_snapshot_after_navigation(browser_setup):
     """
     Test browser_snapshot captures state after navigation.
@@ -154,7 +154,7 @@ async def test_browser_snapshot_after_navigation(browser_setup):
 
 @pytest.mark.integration
 @pytest.mark.slow
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_browser_navigate_back(browser_setup):
     """
     Test browser_navigate_back functionality.
@@ -189,7 +189,7 @@ async def test_browser_navigate_back(browser_setup):
 
 @pytest.mark.integration
 @pytest.mark.slow
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_browser_tools_integration(browser_setup):
     """
     Test integration of multiple browser tools.
@@ -230,7 +230,7 @@ async def test_browser_tools_integration(browser_setup):
 
 @pytest.mark.integration
 @pytest.mark.slow
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_browser_proxy_health(browser_setup):
     """
     Test that the pool manager is healthy and responsive (v2.0.0).
@@ -277,7 +277,7 @@ async def test_browser_proxy_health(browser_setup):
 
 @pytest.mark.integration
 @pytest.mark.slow
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_browser_navigate_github(browser_setup):
     """
     Test navigation to GitHub, a complex JavaScript-heavy website.
@@ -304,7 +304,7 @@ async def test_browser_navigate_github(browser_setup):
 
 @pytest.mark.integration
 @pytest.mark.slow
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_browser_navigate_wikipedia(browser_setup):
     """
     Test navigation to Wikipedia with complex DOM structure.
@@ -331,7 +331,7 @@ async def test_browser_navigate_wikipedia(browser_setup):
 
 @pytest.mark.integration
 @pytest.mark.slow
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_browser_navigate_mdn(browser_setup):
     """
     Test navigation to MDN Web Docs, a technical documentation site.
@@ -358,7 +358,7 @@ async def test_browser_navigate_mdn(browser_setup):
 
 @pytest.mark.integration
 @pytest.mark.slow
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_browser_navigate_stack_overflow(browser_setup):
     """
     Test navigation to Stack Overflow, a Q&A site with complex interactions.
@@ -385,7 +385,7 @@ async def test_browser_navigate_stack_overflow(browser_setup):
 
 @pytest.mark.integration
 @pytest.mark.slow
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_browser_navigate_react_website(browser_setup):
     """
     Test navigation to React.dev, a modern React-based documentation site.
@@ -412,7 +412,7 @@ async def test_browser_navigate_react_website(browser_setup):
 
 @pytest.mark.integration
 @pytest.mark.slow
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_browser_navigate_news_site(browser_setup):
     """
     Test navigation to BBC News, a media-heavy news website.
@@ -439,7 +439,7 @@ async def test_browser_navigate_news_site(browser_setup):
 
 @pytest.mark.integration
 @pytest.mark.slow
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_browser_navigate_multiple_complex_sites(browser_setup):
     """
     Test sequential navigation to multiple complex websites.
@@ -483,7 +483,7 @@ async def test_browser_navigate_multiple_complex_sites(browser_setup):
 
 @pytest.mark.integration
 @pytest.mark.slow
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_browser_navigate_with_redirect(browser_setup):
     """
     Test navigation to a URL that redirects.
@@ -512,7 +512,7 @@ async def test_browser_navigate_with_redirect(browser_setup):
 
 @pytest.mark.integration
 @pytest.mark.slow
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_browser_navigate_form_heavy_site(browser_setup):
     """
     Test navigation to a site with many form elements.
@@ -540,7 +540,7 @@ async def test_browser_navigate_form_heavy_site(browser_setup):
 
 @pytest.mark.integration
 @pytest.mark.slow
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_browser_navigate_table_heavy_site(browser_setup):
     """
     Test navigation to a site with complex table structures.
@@ -567,7 +567,7 @@ async def test_browser_navigate_table_heavy_site(browser_setup):
 
 @pytest.mark.integration
 @pytest.mark.slow
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_browser_navigate_accessibility_features(browser_setup):
     """
     Test navigation to WebAIM, an accessibility-focused website.
@@ -594,7 +594,7 @@ async def test_browser_navigate_accessibility_features(browser_setup):
 
 @pytest.mark.integration
 @pytest.mark.slow
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_browser_navigate_back_complex_workflow(browser_setup):
     """
     Test browser back navigation with complex website workflow.
@@ -637,7 +637,7 @@ async def test_browser_navigate_back_complex_workflow(browser_setup):
 
 @pytest.mark.integration
 @pytest.mark.slow
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_browser_complex_workflow_integration(browser_setup):
     """
     Test a complete complex workflow with multiple operations.
@@ -689,7 +689,7 @@ async def test_browser_complex_workflow_integration(browser_setup):
 
 @pytest.mark.integration
 @pytest.mark.slow
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_jmespath_filter_buttons(browser_setup):
     """
     Test JMESPath filtering to find all buttons on a page.
@@ -729,7 +729,7 @@ async def test_jmespath_filter_buttons(browser_setup):
 
 @pytest.mark.integration
 @pytest.mark.slow
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_jmespath_raw_snapshot_structure(browser_setup):
     """
     Test to see the raw ARIA snapshot structure from example.com.
@@ -774,7 +774,7 @@ async def test_jmespath_raw_snapshot_structure(browser_setup):
 
 @pytest.mark.integration
 @pytest.mark.slow
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_jmespath_filter_headings_with_pagination(browser_setup):
     """
     Test JMESPath filtering to find headings with pagination.
@@ -837,7 +837,7 @@ async def test_jmespath_filter_headings_with_pagination(browser_setup):
 
 @pytest.mark.integration
 @pytest.mark.slow
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_browser_wait_for_time_integer(browser_setup):
     """
     Test browser_wait_for with integer time value using real browser.
@@ -874,7 +874,7 @@ async def test_browser_wait_for_time_integer(browser_setup):
 
 @pytest.mark.integration
 @pytest.mark.slow
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_browser_navigate_then_wait(browser_setup):
     """
     Test browser_navigate followed by browser_wait_for using real browser.
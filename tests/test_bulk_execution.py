@@ -1,6 +1,7 @@
 """Tests for browser_execute_bulk tool."""
 
 import pytest
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, patch
 
 # Import the implementation directly
@@ -303,3 +304,65 @@ async def test_bulk_execution_no_return_results():
         assert result["success"] is True
         assert result["executed_count"] == 3
         assert result["results"] == [None, None, None]
+
+
+@pytest.mark.asyncio
+async def test_bulk_execution_leases_single_instance(mock_pool_manager, mock_proxy_client):
+    """Test all commands in a batch run on one leased instance."""
+    leased_clients = []
+
+    @asynccontextmanager
+    async def lease_instance(instance_key=None):
+        client = AsyncMock()
+        client.call_tool.return_value = {"status": "ok"}
+        leased_clients.append(client)
+        yield client
+
+    mock_pool_manager.get_pool.return_value.lease_instance = lease_instance
+
+    with patch("playwright_proxy_mcp.server.pool_manager", mock_pool_manager):
+        result = await browser_execute_bulk(
+            commands=[
+                {"tool": "browser_click", "args": {"element": "button", "ref": "e1"}},
+                {"tool": "browser_hover", "args": {"element": "link", "ref": "e2"}},
+                {"tool": "browser_press_key", "args": {"key": "Enter"}},
+            ]
+        )
+
+    assert result["success"] is True
+    mock_pool_manager.get_pool.assert_called_once_with(None)
+    # One lease for the whole batch, and every command ran on that client
+    assert len(leased_clients) == 1
+    assert leased_clients[0].call_tool.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_bulk_execution_falls_back_when_pin_lease_fails(mock_pool_manager):
+    """Test commands lease individually when no instance can be pinned for the batch."""
+    leased_clients = []
+
+    @asynccontextmanager
+    async def lease_instance(instance_key=None):
+        if not leased_clients:
+            leased_clients.append(None)
+            raise RuntimeError("No healthy instances available")
+        client = AsyncMock()
+        client.call_tool.return_value = {"status": "ok"}
+        leased_clients.append(client)
+        yield client
+
+    mock_pool_manager.get_pool.return_value.lease_instance = lease_instance
+
+    with patch("playwright_proxy_mcp.server.pool_manager", mock_pool_manager):
+        result = await browser_execute_bulk(
+            commands=[
+                {"tool": "browser_click", "args": {"element": "button", "ref": "e1"}},
+                {"tool": "browser_press_key", "args": {"key": "Enter"}},
+            ]
+        )
+
+    assert result["success"] is True
+    assert result["executed_count"] == 2
+    # The failed pin lease, then one lease per command
+    assert len(leased_clients) == 3
+    assert all(client.call_tool.await_count == 1 for client in leased_clients[1:])
@@ -107,7 +107,7 @@ class TestIntegrationWorkflows:
         assert "storage_root" in blob_config
         assert "max_size_mb" in blob_config
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_real_mcp_server_amazon_screenshot(self, browser_setup):  # noqa: ARG002
         """
         Integration test: Start real MCP server, navigate to Amazon, and take a screenshot.
@@ -161,7 +161,7 @@ class TestIntegrationWorkflows:
         assert metadata is not None, f"Blob {blob_id} should exist in storage"
         assert metadata["size_bytes"] > 0, "Blob should have non-zero size"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_real_mcp_server_amazon_search(self, browser_setup):  # noqa: ARG002
         """
         Integration test: Navigate to Amazon and search for trousers.
@@ -224,7 +224,7 @@ class TestIntegrationWorkflows:
             "Response should not be excessively large (>10MB)"
         )
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_amazon_screenshot_resolution_viewport_only(self, browser_setup):  # noqa: ARG002
         """
         Test screenshot resolution with full_page=False (viewport only).
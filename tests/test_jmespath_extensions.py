@@ -4,6 +4,7 @@ import pytest
 
 from playwright_proxy_mcp.utils.jmespath_extensions import (
     CustomFunctions,
+    compile_expression,
     search_with_custom_functions,
 )
 
@@ -199,3 +200,14 @@ class TestSearchWithCustomFunctions:
         assert len(result) == 2
         assert result[0] == {"name": "Click me", "level": 1}
         assert result[1] == {"name": "Submit", "level": 3}
+
+    def test_repeated_expression_is_compiled_once(self):
+        expression = "[?role == `heading`].name"
+        assert compile_expression(expression) is compile_expression(expression)
+        data = [{"role": "heading", "name": "Title"}, {"role": "link", "name": "Home"}]
+        assert search_with_custom_functions(expression, data) == ["Title"]
+        assert search_with_custom_functions(expression, data) == ["Title"]
+
+    def test_invalid_expression_raises(self):
+        with pytest.raises(Exception):
+            search_with_custom_functions("[?invalid", [])
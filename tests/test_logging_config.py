@@ -0,0 +1,161 @@
+"""Tests for logging_config module."""
+
+import logging
+import logging.handlers
+import threading
+
+import pytest
+
+from playwright_proxy_mcp.utils import logging_config
+from playwright_proxy_mcp.utils.logging_config import (
+    flush_tool_result_logs,
+    log_dict,
+    log_tool_result,
+    setup_file_logging,
+)
+
+
+@pytest.fixture
+def restore_root_logger():
+    """Put back the root logger configuration replaced by setup_file_logging."""
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield
+    logging_config._stop_queue_listener()
+    for handler in root.handlers:
+        handler.close()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+class TestSetupFileLogging:
+    """Tests for setup_file_logging"""
+
+    def test_writes_formatted_records_through_queue(self, tmp_path, restore_root_logger):
+        log_file = tmp_path / "logs" / "server.log"
+        setup_file_logging(log_file=log_file, format_string="%(levelname)s|%(message)s")
+
+        root = logging.getLogger()
+        assert isinstance(root.handlers[0], logging.handlers.QueueHandler)
+        logging.getLogger("test_setup").warning("hello %s", "world")
+
+        # Stopping the listener drains the queue to disk
+        logging_config._stop_queue_listener()
+        lines = log_file.read_text(encoding="utf-8").splitlines()
+        assert lines[0].startswith("INFO|Logging configured")
+        assert lines[1] == "WARNING|hello world"
+
+    def test_uses_rotating_file_handler(self, tmp_path, restore_root_logger):
+        setup_file_logging(log_file=tmp_path / "server.log")
+        setup_file_logging(log_file=tmp_path / "server.log")
+
+        (file_handler,) = logging_config._queue_listener.handlers
+        assert isinstance(file_handler, logging.handlers.RotatingFileHandler)
+        assert file_handler.maxBytes == logging_config._MAX_LOG_BYTES
+
+
+class TestLogDict:
+    """Tests for log_dict"""
+
+    def test_masks_sensitive_keys_case_insensitively(self, caplog):
+        logger = logging.getLogger("test_log_dict")
+        data = {"API_Key": "abc", "authToken": "def", "Password": "ghi", "timeout": 30}
+
+        with caplog.at_level(logging.INFO, logger="test_log_dict"):
+            log_dict(logger, "Config:", data)
+
+        assert caplog.messages == [
+            "Config:",
+            "  API_Key: ***REDACTED***",
+            "  authToken: ***REDACTED***",
+            "  Password: ***REDACTED***",
+            "  timeout: 30",
+        ]
+
+
+class TestLogToolResult:
+    """Tests for log_tool_result decorator"""
+
+    async def test_logs_result_as_json(self, caplog):
+        logger = logging.getLogger("test_log_tool_result")
+
+        @log_tool_result(logger)
+        async def my_tool() -> dict:
+            return {"success": True, "items": [1, 2], 3: "non-str key"}
+
+        with caplog.at_level(logging.INFO, logger="test_log_tool_result"):
+            result = await my_tool()
+            await flush_tool_result_logs()
+
+        assert result == {"success": True, "items": [1, 2], 3: "non-str key"}
+        assert 'TOOL_RESULT [my_tool]:\n{\n  "success": true,' in caplog.text
+        assert '"3": "non-str key"' in caplog.text
+
+    async def test_non_json_values_use_str(self, caplog):
+        logger = logging.getLogger("test_log_tool_result")
+
+        class Opaque:
+            def __str__(self) -> str:
+                return "opaque-value"
+
+        @log_tool_result(logger)
+        async def my_tool() -> dict:
+            return {"value": Opaque()}
+
+        with caplog.at_level(logging.INFO, logger="test_log_tool_result"):
+            await my_tool()
+            await flush_tool_result_logs()
+
+        assert '"value": "opaque-value"' in caplog.text
+
+    async def test_returns_before_result_is_logged(self, caplog, monkeypatch):
+        logger = logging.getLogger("test_log_tool_result")
+        release = threading.Event()
+        emit = logging_config._emit_tool_result
+
+        def blocked_emit(*args):
+            release.wait(timeout=5)
+            emit(*args)
+
+        monkeypatch.setattr(logging_config, "_emit_tool_result", blocked_emit)
+
+        @log_tool_result(logger)
+        async def my_tool() -> dict:
+            return {"success": True}
+
+        with caplog.at_level(logging.INFO, logger="test_log_tool_result"):
+            assert await my_tool() == {"success": True}
+            assert "TOOL_RESULT" not in caplog.text
+
+            release.set()
+            await flush_tool_result_logs()
+
+        assert "TOOL_RESULT [my_tool]" in caplog.text
+
+    async def test_logs_inline_when_backlog_is_full(self, caplog, monkeypatch):
+        logger = logging.getLogger("test_log_tool_result")
+        monkeypatch.setattr(logging_config, "_MAX_PENDING_RESULT_LOGS", 0)
+
+        @log_tool_result(logger)
+        async def my_tool() -> dict:
+            return {"success": True}
+
+        with caplog.at_level(logging.INFO, logger="test_log_tool_result"):
+            await my_tool()
+
+            # Logged before returning, without waiting on the worker threads
+            assert "TOOL_RESULT [my_tool]" in caplog.text
+        assert not logging_config._pending_result_logs
+
+    async def test_skips_logging_when_info_disabled(self, caplog):
+        logger = logging.getLogger("test_log_tool_result")
+
+        @log_tool_result(logger)
+        async def my_tool() -> str:
+            return "done"
+
+        with caplog.at_level(logging.WARNING, logger="test_log_tool_result"):
+            assert await my_tool() == "done"
+
+        assert "TOOL_RESULT" not in caplog.text
+        assert not logging_config._pending_result_logs
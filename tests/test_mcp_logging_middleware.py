@@ -150,7 +150,7 @@ class TestMCPLoggingMiddleware:
         """Test that small data is not truncated"""
         data = {"key": "value"}
         result = middleware_full_logging._truncate_data(data, max_length=100)
-        assert '"key": "value"' in result
+        assert '"key":"value"' in result
         assert "..." not in result
 
     def test_truncate_data_large(self, middleware_full_logging):
@@ -270,6 +270,14 @@ class TestBinaryInterceptionMiddleware:
         assert "playwright_screenshot" in middleware.BINARY_TOOLS
         assert "playwright_pdf" in middleware.BINARY_TOOLS
         assert "playwright_save_as_pdf" in middleware.BINARY_TOOLS
+        assert "browser_pdf_save" in middleware.BINARY_TOOLS
+
+    def test_blob_candidate_tools_constant(self, middleware):
+        """Test that BLOB_CANDIDATE_TOOLS covers binary and conditional tools only."""
+        assert middleware.BLOB_CANDIDATE_TOOLS == (
+            middleware.BINARY_TOOLS | middleware.CONDITIONAL_BINARY_TOOLS
+        )
+        assert "browser_navigate" not in middleware.BLOB_CANDIDATE_TOOLS
 
     @pytest.mark.asyncio
     async def test_conditional_binary_tools_constant(self, middleware):
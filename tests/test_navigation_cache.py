@@ -1,11 +1,16 @@
 """Tests for navigation_cache module."""
 
+import asyncio
 import time
 from unittest.mock import patch
 
 import pytest
 
-from playwright_proxy_mcp.utils.navigation_cache import CacheEntry, NavigationCache
+from playwright_proxy_mcp.utils.navigation_cache import (
+    MAX_DERIVED_RESULTS,
+    CacheEntry,
+    NavigationCache,
+)
 
 
 class TestCacheEntry:
@@ -39,6 +44,26 @@ class TestCacheEntry:
         entry.touch()
         assert entry.last_accessed > original_time
 
+    def test_store_derived(self):
+        entry = CacheEntry(url="https://example.com", snapshot_json={"data": "test"})
+        assert entry.derived == {}
+        entry.store_derived((True, "[?role == 'button']"), [{"role": "button"}])
+        assert entry.derived[(True, "[?role == 'button']")] == [{"role": "button"}]
+
+    def test_store_derived_evicts_oldest(self):
+        entry = CacheEntry(url="https://example.com", snapshot_json={"data": "test"})
+        for i in range(MAX_DERIVED_RESULTS + 1):
+            entry.store_derived((False, f"q{i}"), [i])
+        assert len(entry.derived) == MAX_DERIVED_RESULTS
+        assert (False, "q0") not in entry.derived
+        assert entry.derived[(False, f"q{MAX_DERIVED_RESULTS}")] == [MAX_DERIVED_RESULTS]
+
+    def test_uses_slots(self):
+        entry = CacheEntry(url="https://example.com", snapshot_json={"data": "test"})
+        assert not hasattr(entry, "__dict__")
+        with pytest.raises(AttributeError):
+            entry.unknown = True
+
 
 class TestNavigationCache:
     """Tests for NavigationCache class"""
@@ -53,6 +78,7 @@ class TestNavigationCache:
 
     def test_init_default_ttl(self, cache):
         assert cache._default_ttl == 300
+        assert cache._max_entries == 64
         assert len(cache._cache) == 0
 
     def test_init_custom_ttl(self, custom_ttl_cache):
@@ -168,6 +194,23 @@ class TestNavigationCache:
         assert key1 not in cache._cache
         assert key2 in cache._cache
 
+    def test_lazy_cleanup_requeues_touched_entry(self, cache):
+        # Scheduled deadline passes, but the entry was touched in the meantime
+        key = cache.create("https://example.com", {"data": "test"}, ttl=300)
+        cache._expiry_heap[0] = (0.0, key)
+
+        cache._lazy_cleanup()
+        assert key in cache._cache
+        assert cache._expiry_heap[0][0] > time.monotonic()
+
+    def test_lazy_cleanup_skips_deleted_keys(self, cache):
+        key = cache.create("https://example.com", {"data": "test"}, ttl=0)
+        cache.delete(key)
+        time.sleep(0.01)
+
+        cache._lazy_cleanup()
+        assert cache._expiry_heap == []
+
     def test_len(self, cache):
         assert len(cache) == 0
         cache.create("https://example.com", {"data": "test1"})
@@ -195,3 +238,73 @@ class TestNavigationCache:
         entry2 = cache.get(key)
         assert entry1 is entry2  # Same object
         assert entry1.url == "https://example.com"
+
+    def test_create_evicts_least_recently_used(self):
+        cache = NavigationCache(max_entries=2)
+        key1 = cache.create("https://example.com/1", {"data": 1})
+        key2 = cache.create("https://example.com/2", {"data": 2})
+        cache.get(key1)  # key2 is now least recently used
+        key3 = cache.create("https://example.com/3", {"data": 3})
+        assert len(cache) == 2
+        assert key2 not in cache._cache
+        assert key1 in cache._cache
+        assert key3 in cache._cache
+
+    async def test_get_or_create_returns_cached_entry(self, cache):
+        key = cache.create("https://example.com", {"data": "test"})
+
+        async def fetch():
+            raise AssertionError("fetch should not run on a cache hit")
+
+        result_key, entry = await cache.get_or_create(key, "https://example.com", fetch)
+        assert result_key == key
+        assert entry.snapshot_json == {"data": "test"}
+
+    async def test_get_or_create_without_key_fetches(self, cache):
+        async def fetch():
+            return {"data": "fresh"}
+
+        key, entry = await cache.get_or_create(None, "https://example.com", fetch)
+        assert key in cache._cache
+        assert entry.snapshot_json == {"data": "fresh"}
+        assert entry.url == "https://example.com"
+
+    async def test_get_or_create_shares_concurrent_misses(self, cache):
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"data": "fresh"}
+
+        results = await asyncio.gather(
+            *(cache.get_or_create("nav_missing", "https://example.com", fetch) for _ in range(3))
+        )
+        assert calls == 1
+        assert len({key for key, _ in results}) == 1
+        assert len(cache) == 1
+        assert cache._pending == {}
+
+    async def test_get_or_create_does_not_share_misses_across_urls(self, cache):
+        async def fetch_for(url):
+            await asyncio.sleep(0.01)
+            return {"data": url}
+
+        (_, first), (_, second) = await asyncio.gather(
+            cache.get_or_create("nav_missing", "https://a.example", lambda: fetch_for("a")),
+            cache.get_or_create("nav_missing", "https://b.example", lambda: fetch_for("b")),
+        )
+        assert (first.url, first.snapshot_json) == ("https://a.example", {"data": "a"})
+        assert (second.url, second.snapshot_json) == ("https://b.example", {"data": "b"})
+        assert len(cache) == 2
+
+    async def test_get_or_create_propagates_fetch_error(self, cache):
+        async def fetch():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            await cache.get_or_create("nav_missing", "https://example.com", fetch)
+        await asyncio.sleep(0)
+        assert len(cache) == 0
+        assert cache._pending == {}
@@ -157,6 +157,43 @@ class TestBrowserPool:
             assert mock_create.call_count == 2
             assert browser_pool.lease_queue is not None
 
+    async def test_initialize_concurrent_preserves_order(
+        self, browser_pool, mock_blob_manager, mock_middleware
+    ):
+        release_first = asyncio.Event()
+
+        async def mock_create_instance(cfg, bm, mw):
+            # Instance "0" finishes last; it must still come first in the pool
+            if cfg["instance_id"] == "0":
+                await release_first.wait()
+            else:
+                release_first.set()
+            browser_pool.instances[cfg["instance_id"]] = Mock(alias=None)
+
+        with patch.object(browser_pool, "_create_instance", new=mock_create_instance):
+            await browser_pool.initialize(mock_blob_manager, mock_middleware)
+
+        assert list(browser_pool.instances) == ["0", "1"]
+        assert browser_pool.healthy_instance_count == 2
+
+    async def test_initialize_instance_failure(
+        self, browser_pool, mock_blob_manager, mock_middleware
+    ):
+        started = AsyncMock(spec=BrowserInstance)
+
+        async def mock_create_instance(cfg, bm, mw):
+            if cfg["instance_id"] == "1":
+                raise RuntimeError("instance 1 failed to start")
+            browser_pool.instances["0"] = started
+
+        with patch.object(browser_pool, "_create_instance", new=mock_create_instance):
+            with pytest.raises(RuntimeError, match="instance 1 failed to start"):
+                await browser_pool.initialize(mock_blob_manager, mock_middleware)
+
+        # The instance that did start is stopped rather than orphaned
+        started.stop.assert_awaited_once()
+        assert browser_pool.lease_queue is None
+
     async def test_create_instance(self, browser_pool, mock_blob_manager, mock_middleware):
         instance_cfg = InstanceConfig(
             instance_id="0",
@@ -168,6 +205,9 @@ class TestBrowserPool:
             "playwright_proxy_mcp.playwright.pool_manager.PlaywrightProxyClient"
         ) as MockClient:
             mock_client = AsyncMock()
+            process = mock_client._client._transport._process
+            process.stdout.read = AsyncMock(return_value=b"")
+            process.stderr.read = AsyncMock(return_value=b"")
             MockClient.return_value = mock_client
 
             await browser_pool._create_instance(instance_cfg, mock_blob_manager, mock_middleware)
@@ -264,6 +304,27 @@ class TestBrowserPool:
         assert status["instances"][0]["id"] == "0"
         assert status["instances"][0]["leased"] is False
 
+    async def test_check_all_health_updates_healthy_count(self, browser_pool):
+        instance0 = AsyncMock(spec=BrowserInstance)
+        instance0.instance_id = "0"
+        instance0.health_check_error = None
+        instance0.check_health.return_value = True
+        instance1 = AsyncMock(spec=BrowserInstance)
+        instance1.instance_id = "1"
+        instance1.health_check_error = "Process exited"
+        instance1.check_health.return_value = False
+
+        browser_pool.instances["0"] = instance0
+        browser_pool.instances["1"] = instance1
+
+        await browser_pool.check_all_health()
+        assert browser_pool.healthy_instance_count == 1
+
+        instance1.check_health.side_effect = Exception("Connection error")
+        instance0.check_health.return_value = False
+        await browser_pool.check_all_health()
+        assert browser_pool.healthy_instance_count == 0
+
     async def test_stop(self, browser_pool):
         instance0 = AsyncMock(spec=BrowserInstance)
         instance1 = AsyncMock(spec=BrowserInstance)
@@ -340,6 +401,37 @@ class TestPoolManager:
                 mock_blob_manager, mock_middleware
             )
 
+    async def test_initialize_pool_failure_stops_started_pools(
+        self, pool_manager_config, mock_blob_manager, mock_middleware
+    ):
+        pool_manager_config["pools"].append(
+            PoolConfig(
+                name="SECONDARY",
+                instances=1,
+                is_default=False,
+                description="Secondary pool",
+                base_config={},
+                instance_configs=[InstanceConfig(instance_id="0", alias=None, config={})],
+            )
+        )
+        manager = PoolManager(pool_manager_config, mock_blob_manager, mock_middleware)
+
+        started_pool = AsyncMock()
+        failed_pool = AsyncMock()
+        failed_pool.initialize.side_effect = RuntimeError("pool failed to start")
+
+        with patch(
+            "playwright_proxy_mcp.playwright.pool_manager.BrowserPool",
+            side_effect=[started_pool, failed_pool],
+        ):
+            with pytest.raises(RuntimeError, match="pool failed to start"):
+                await manager.initialize()
+
+        started_pool.stop.assert_awaited_once()
+        failed_pool.stop.assert_not_awaited()
+        assert manager.pools == {}
+        assert manager._health_check_task is None
+
     async def test_get_pool_default(self, pool_manager_config, mock_blob_manager, mock_middleware):
         manager = PoolManager(pool_manager_config, mock_blob_manager, mock_middleware)
 
@@ -347,10 +439,8 @@ class TestPoolManager:
         with patch("playwright_proxy_mcp.playwright.pool_manager.BrowserPool") as MockPool:
             mock_pool_instance = AsyncMock()
             mock_pool_instance.name = "DEFAULT"
-            # Add mock instance with health_check_error
-            mock_instance = Mock()
-            mock_instance.health_check_error = None  # Healthy instance
-            mock_pool_instance.instances = {"0": mock_instance}
+            mock_pool_instance.instances = {"0": Mock()}
+            mock_pool_instance.healthy_instance_count = 1
             MockPool.return_value = mock_pool_instance
             await manager.initialize()
 
@@ -364,16 +454,30 @@ class TestPoolManager:
         with patch("playwright_proxy_mcp.playwright.pool_manager.BrowserPool") as MockPool:
             mock_pool_instance = AsyncMock()
             mock_pool_instance.name = "DEFAULT"
-            # Add mock instance with health_check_error
-            mock_instance = Mock()
-            mock_instance.health_check_error = None  # Healthy instance
-            mock_pool_instance.instances = {"0": mock_instance}
+            mock_pool_instance.instances = {"0": Mock()}
+            mock_pool_instance.healthy_instance_count = 1
             MockPool.return_value = mock_pool_instance
             await manager.initialize()
 
         pool = manager.get_pool("DEFAULT")
         assert pool.name == "DEFAULT"
 
+    async def test_get_pool_default_unhealthy(
+        self, pool_manager_config, mock_blob_manager, mock_middleware
+    ):
+        manager = PoolManager(pool_manager_config, mock_blob_manager, mock_middleware)
+
+        with patch("playwright_proxy_mcp.playwright.pool_manager.BrowserPool") as MockPool:
+            mock_pool_instance = AsyncMock()
+            mock_pool_instance.name = "DEFAULT"
+            mock_pool_instance.instances = {"0": Mock()}
+            mock_pool_instance.healthy_instance_count = 0
+            MockPool.return_value = mock_pool_instance
+            await manager.initialize()
+
+        with pytest.raises(ValueError, match="has no healthy instances"):
+            manager.get_pool(None)
+
     async def test_get_pool_not_found(self, pool_manager_config, mock_blob_manager, mock_middleware):
         manager = PoolManager(pool_manager_config, mock_blob_manager, mock_middleware)
 
@@ -25,12 +25,12 @@ def mock_subprocess():
 
     # Mock stdout stream
     mock_stdout = Mock()
-    mock_stdout.readline = AsyncMock(return_value=b"")
+    mock_stdout.read = AsyncMock(return_value=b"")
     mock_process.stdout = mock_stdout
 
     # Mock stderr stream
     mock_stderr = Mock()
-    mock_stderr.readline = AsyncMock(return_value=b"")
+    mock_stderr.read = AsyncMock(return_value=b"")
     mock_process.stderr = mock_stderr
 
     return mock_process
@@ -99,3 +99,17 @@ class TestPlaywrightProcessManager:
         # Should not raise
         await process_manager.stop()
         assert process_manager.process is None
+
+    @pytest.mark.asyncio
+    async def test_iter_lines(self):
+        """Test lines are split across chunk boundaries and oversized lines are flushed."""
+        stream = asyncio.StreamReader()
+        stream.feed_data(b"first\nsec")
+        stream.feed_data(b"ond\n" + b"x" * (70 * 1024) + b"\ntail")
+        stream.feed_eof()
+
+        lines = [line async for line in PlaywrightProcessManager._iter_lines(stream)]
+
+        assert lines[:2] == [b"first", b"second"]
+        assert b"".join(lines[2:-1]) == b"x" * (70 * 1024)
+        assert lines[-1] == b"tail"
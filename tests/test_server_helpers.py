@@ -7,7 +7,12 @@ from playwright_proxy_mcp.server import (
     _create_evaluation_error,
     _validate_evaluation_params,
     _extract_blob_id_from_response,
+    _extract_text_content,
+    _derive_snapshot_data,
+    _paginate,
+    _unwrap_blob_result,
 )
+from playwright_proxy_mcp.utils.navigation_cache import CacheEntry
 
 
 class TestCreateNavigationError:
@@ -66,12 +71,92 @@ class TestCreateNavigationError:
         assert result["limit"] == 100
 
 
+class TestExtractTextContent:
+    """Tests for _extract_text_content helper function."""
+
+    def test_returns_first_text_item(self):
+        """Test that the first text item's text is returned."""
+        result = {
+            "content": [
+                {"type": "image", "data": "abc"},
+                {"type": "text", "text": "- button \"OK\""},
+                {"type": "text", "text": "second"},
+            ]
+        }
+        assert _extract_text_content(result) == '- button "OK"'
+
+    def test_returns_none_without_text_item(self):
+        """Test that None is returned when no text item exists."""
+        assert _extract_text_content({"content": [{"type": "image"}]}) is None
+        assert _extract_text_content({"content": None}) is None
+        assert _extract_text_content({}) is None
+
+    def test_returns_none_for_non_dict(self):
+        """Test that non-dict responses return None."""
+        assert _extract_text_content("text") is None
+        assert _extract_text_content(None) is None
+
+
+class TestPaginate:
+    """Tests for _paginate helper function."""
+
+    def test_list_page(self):
+        """Test slicing a page out of a list."""
+        assert _paginate(list(range(10)), 2, 3) == ([2, 3, 4], 10, True)
+
+    def test_list_last_page(self):
+        """Test that the last page reports no more items."""
+        assert _paginate(list(range(10)), 8, 5) == ([8, 9], 10, False)
+
+    def test_single_item_first_page(self):
+        """Test that a non-list result is wrapped on the first page."""
+        assert _paginate({"a": 1}, 0, 100) == ([{"a": 1}], 1, False)
+
+    def test_single_item_beyond_offset(self):
+        """Test that a non-list result yields an empty page past offset 0."""
+        assert _paginate({"a": 1}, 1, 100) == ([], 1, False)
+
+
+class TestDeriveSnapshotData:
+    """Tests for _derive_snapshot_data helper function."""
+
+    SNAPSHOT = [{"role": "button", "name": "OK"}, {"role": "link", "name": "Home"}]
+
+    def test_returns_snapshot_unchanged_without_flatten_or_query(self):
+        """Test that the raw snapshot is returned when nothing is requested."""
+        entry = CacheEntry(url="", snapshot_json=self.SNAPSHOT)
+        result, error = _derive_snapshot_data(self.SNAPSHOT, entry, False, None)
+        assert result is self.SNAPSHOT
+        assert error is None
+        assert entry.derived == {}
+
+    def test_memoizes_query_result_on_entry(self):
+        """Test that a repeated query is served from the cache entry."""
+        entry = CacheEntry(url="", snapshot_json=self.SNAPSHOT)
+        query = "[?role == 'button']"
+        first, error = _derive_snapshot_data(self.SNAPSHOT, entry, False, query)
+        assert error is None
+        assert first == [{"role": "button", "name": "OK"}]
+        assert entry.derived[(False, query)] is first
+
+        second, _ = _derive_snapshot_data(self.SNAPSHOT, entry, False, query)
+        assert second is first
+
+    def test_query_error_is_not_memoized(self):
+        """Test that failed queries return an error and are not cached."""
+        entry = CacheEntry(url="", snapshot_json=self.SNAPSHOT)
+        result, error = _derive_snapshot_data(self.SNAPSHOT, entry, False, "[?invalid")
+        assert result is None
+        assert error is not None
+        assert entry.derived == {}
+
+
 class TestValidateNavigationParams:
     """Tests for _validate_navigation_params helper function."""
 
     def test_valid_params_returns_none(self):
         """Test that valid parameters return None."""
-        error = _validate_navigation_params(
+        _, error = _validate_navigation_params(
             output_format="yaml",
             offset=0,
             limit=100,
@@ -83,7 +168,7 @@ class TestValidateNavigationParams:
 
     def test_valid_params_with_jmespath_returns_none(self):
         """Test that valid parameters with JMESPath return None."""
-        error = _validate_navigation_params(
+        _, error = _validate_navigation_params(
             output_format="json",
             offset=10,
             limit=50,
@@ -95,7 +180,7 @@ class TestValidateNavigationParams:
 
     def test_invalid_output_format(self):
         """Test that invalid output format returns error."""
-        error = _validate_navigation_params(
+        _, error = _validate_navigation_params(
             output_format="xml",
             offset=0,
             limit=100,
@@ -107,7 +192,7 @@ class TestValidateNavigationParams:
 
     def test_negative_offset(self):
         """Test that negative offset returns error."""
-        error = _validate_navigation_params(
+        _, error = _validate_navigation_params(
             output_format="yaml",
             offset=-5,
             limit=100,
@@ -119,7 +204,7 @@ class TestValidateNavigationParams:
 
     def test_limit_too_low(self):
         """Test that limit < 1 returns error."""
-        error = _validate_navigation_params(
+        _, error = _validate_navigation_params(
             output_format="yaml",
             offset=0,
             limit=0,
@@ -131,7 +216,7 @@ class TestValidateNavigationParams:
 
     def test_limit_too_high(self):
         """Test that limit > 10000 returns error."""
-        error = _validate_navigation_params(
+        _, error = _validate_navigation_params(
             output_format="yaml",
             offset=0,
             limit=10001,
@@ -143,7 +228,7 @@ class TestValidateNavigationParams:
 
     def test_pagination_without_flatten_query_or_cache(self):
         """Test that pagination without flatten/query/cache returns error."""
-        error = _validate_navigation_params(
+        _, error = _validate_navigation_params(
             output_format="yaml",
             offset=10,
             limit=100,
@@ -155,7 +240,7 @@ class TestValidateNavigationParams:
 
     def test_non_default_limit_without_flatten_query_or_cache(self):
         """Test that non-default limit without flatten/query/cache returns error."""
-        error = _validate_navigation_params(
+        _, error = _validate_navigation_params(
             output_format="yaml",
             offset=0,
             limit=500,
@@ -167,7 +252,7 @@ class TestValidateNavigationParams:
 
     def test_pagination_with_cache_key_is_valid(self):
         """Test that pagination with cache_key is valid."""
-        error = _validate_navigation_params(
+        _, error = _validate_navigation_params(
             output_format="yaml",
             offset=10,
             limit=100,
@@ -179,7 +264,7 @@ class TestValidateNavigationParams:
 
     def test_default_params_without_pagination_is_valid(self):
         """Test that default params (offset=0, limit=1000) without flatten is valid."""
-        error = _validate_navigation_params(
+        _, error = _validate_navigation_params(
             output_format="yaml",
             offset=0,
             limit=1000,
@@ -191,7 +276,7 @@ class TestValidateNavigationParams:
 
     def test_case_insensitive_output_format(self):
         """Test that output format validation is case-insensitive."""
-        error = _validate_navigation_params(
+        output_format, error = _validate_navigation_params(
             output_format="JSON",
             offset=0,
             limit=100,
@@ -200,8 +285,9 @@ class TestValidateNavigationParams:
             cache_key=None,
         )
         assert error is None
+        assert output_format == "json"
 
-        error = _validate_navigation_params(
+        _, error = _validate_navigation_params(
             output_format="YAML",
             offset=0,
             limit=100,
@@ -358,3 +444,17 @@ class TestExtractBlobIdFromResponse:
         }
         blob_id = _extract_blob_id_from_response(result)
         assert blob_id == "blob://first.png"
+
+
+class TestUnwrapBlobResult:
+    """Tests for _unwrap_blob_result helper function."""
+
+    def test_returns_blob_id(self):
+        """Test that the blob URI is returned when present."""
+        result = {"content": [{"type": "blob", "blob_id": "blob://shot.png"}]}
+        assert _unwrap_blob_result(result, "screenshot") == "blob://shot.png"
+
+    def test_raises_with_artifact_name(self):
+        """Test that a missing blob URI raises RuntimeError naming the artifact."""
+        with pytest.raises(RuntimeError, match="Failed to extract blob URI from PDF result"):
+            _unwrap_blob_result({"content": []}, "PDF")